@@ -254,9 +254,6 @@ def organize(ctx, directory, dry_run, output_dir, movies_dir, tv_shows_dir, musi
         click.echo("No media files found.")
         return
     
-    # Create organizer
-    organizer = FileOrganizer(config, logger)
-    
     # Determine output directory
     # If no output directory is specified and none in config, use input directory
     input_directory = Path(directory)
@@ -291,6 +288,9 @@ def organize(ctx, directory, dry_run, output_dir, movies_dir, tv_shows_dir, musi
     if output_dir:
         config.set('organization.output_directory', output_dir)
     
+    # Create organizer (after output directory overrides are applied to config)
+    organizer = FileOrganizer(config, logger)
+    
     # Display output directories
     if dry_run:
         click.echo("\n=== DRY RUN MODE - No files will be modified ===\n")
@@ -314,11 +314,10 @@ def organize(ctx, directory, dry_run, output_dir, movies_dir, tv_shows_dir, musi
     media_groups = {}
     
     plan_progress = tqdm(total=total_count, desc="Planning moves", unit="file", ncols=100)
+    move_plans = organizer.plan_moves(files, progress_bar=plan_progress)
+    plan_progress.close()
     
-    for file_path in files:
-        move_plan = organizer.plan_file_move(file_path, None)
-        plan_progress.update(1)
-        
+    for move_plan in move_plans:
         if move_plan['changed']:
             changed_count += 1
             media_type = move_plan['media_type']
@@ -328,8 +327,6 @@ def organize(ctx, directory, dry_run, output_dir, movies_dir, tv_shows_dir, musi
             
             media_groups[media_type].append(move_plan)
     
-    plan_progress.close()
-    
     # Display organized by media type (concise format)
     for media_type, plans in media_groups.items():
         click.echo(f"\n{media_type.upper()}: {len(plans)} file(s)")
@@ -417,6 +414,9 @@ def organize(ctx, directory, dry_run, output_dir, movies_dir, tv_shows_dir, musi
         # Get the input directory to compare with output
         input_directory = Path(directory)
         
+        # Listings cached while planning are re-read as files are moved
+        organizer.clear_dir_cache()
+        
         for file_path in files:
             move_plan = organizer.plan_file_move(file_path, None)
             if move_plan['changed']:
@@ -43,8 +43,9 @@ class DuplicateFinder:
         file_info = []
         for file_path in file_paths:
             try:
-                size = get_file_size(file_path)
-                mtime = file_path.stat().st_mtime
+                stat_result = file_path.stat()
+                size = get_file_size(file_path, stat_result)
+                mtime = stat_result.st_mtime
                 file_info.append({
                     'path': file_path,
                     'size': size,
@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
-from ..utils.file_utils import get_file_hash, get_file_size
+from ..utils.file_utils import PARTIAL_HASH_SIZE, get_file_hash, get_file_size, hash_many
 
 
 class FileHasher:
@@ -23,8 +23,9 @@ class FileHasher:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self.algorithm = config.get('advanced.hash_algorithm', 'md5')
-        self.chunk_size = config.get('advanced.chunk_size', 8192)
+        self.chunk_size = config.get('advanced.chunk_size', 1 << 20)
         self.max_workers = config.get('advanced.max_workers', 4)
+        self.executor = config.get('advanced.hash_executor', 'threads')
     
     def hash_file(self, file_path: Path) -> Optional[str]:
         """
@@ -38,10 +39,25 @@ class FileHasher:
         """
         return get_file_hash(file_path, self.algorithm, self.chunk_size)
     
+    def partial_hash(self, file_path: Path) -> Optional[str]:
+        """
+        Calculate a quick hash of the start of a file (see get_file_hash).
+        
+        Args:
+            file_path: Path to file
+        
+        Returns:
+            Partial hash or None if error
+        """
+        return get_file_hash(file_path, self.algorithm, self.chunk_size, mode='partial')
+    
     def hash_files(self, file_paths: list, progress_bar: Optional[tqdm] = None) -> Dict[Path, str]:
         """
         Calculate hashes for multiple files in parallel.
         
+        Files are hashed in a thread pool, or with advanced.hash_executor set
+        to "processes", in a process pool via hash_many().
+        
         Args:
             file_paths: List of file paths
             progress_bar: Optional progress bar to update
@@ -49,6 +65,15 @@ class FileHasher:
         Returns:
             Dictionary mapping file path to hash
         """
+        if self.executor == 'processes':
+            def on_hashed(file_path: Path, hash_value: Optional[str]) -> None:
+                if progress_bar:
+                    progress_bar.set_description(f"Hashing: {file_path.name[:40]}")
+                    progress_bar.update(1)
+            
+            return hash_many(file_paths, self.algorithm, self.chunk_size,
+                             self.max_workers, on_hashed)
+        
         hash_map = {}
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -89,7 +114,52 @@ class FileHasher:
             Dictionary mapping hash to list of duplicate file paths
         """
         self.logger.info(f"Hashing {len(files)} files for duplicate detection...")
-        hash_map = self.hash_files(files, progress_bar)
+        
+        # Only files sharing their size with another file can be duplicates.
+        # Among those, files over the partial hash size are narrowed down
+        # further by a hash of their start; only files that still collide are
+        # read in full.
+        by_size = {}
+        for file_path in files:
+            by_size.setdefault(get_file_size(file_path), []).append(file_path)
+        
+        candidates = []
+        to_narrow = []
+        skipped = 0
+        for size, group in by_size.items():
+            if len(group) < 2:
+                skipped += len(group)
+            elif size > PARTIAL_HASH_SIZE:
+                to_narrow.extend((size, file_path) for file_path in group)
+            else:
+                candidates.extend(group)
+        
+        if to_narrow:
+            by_partial = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    (size, file_path, executor.submit(self.partial_hash, file_path))
+                    for size, file_path in to_narrow
+                ]
+                for size, file_path, future in futures:
+                    try:
+                        partial = future.result()
+                    except Exception as e:
+                        # A file that can't be hashed can't be matched either
+                        self.logger.error(f"Error hashing {file_path}: {e}")
+                        partial = None
+                    by_partial.setdefault((size, partial), []).append(file_path)
+            
+            for (_, partial), group in by_partial.items():
+                if partial is not None and len(group) > 1:
+                    candidates.extend(group)
+                else:
+                    skipped += len(group)
+        
+        if progress_bar and skipped:
+            progress_bar.update(skipped)
+        
+        hash_map = self.hash_files(candidates, progress_bar)
         
         # Group files by hash
         hash_to_files = {}
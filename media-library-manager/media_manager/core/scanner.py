@@ -22,7 +22,7 @@ class MediaScanner:
         """
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
-        self.extensions = config.get_all_extensions()
+        self.extensions = config.get_supported_extensions()
         self.ignore_patterns = config.get('advanced.ignore_patterns', [])
     
     def scan_directory(self, directory: str, progress_bar: Optional[tqdm] = None) -> List[Path]:
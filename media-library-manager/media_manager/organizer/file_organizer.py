@@ -1,16 +1,508 @@
 """File organization and naming standardization."""
 
+import errno
 import logging
 import re
 import os
 import shutil
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Set, Tuple, Optional, Union
 from datetime import datetime
+from functools import lru_cache
 
 from ..utils.file_utils import clean_filename, get_file_extension, get_file_mtime, get_file_size, move_file_cross_device
 
 
+# Filename cleanup (sanitize_filename)
+# Leading [Group] tag (after any whitespace) and {Group} tags anywhere, in one pass
+_GROUP_TAGS = re.compile(r'^\s*\[[^\]\n]*\]|\{[^}\n]*\}')
+# Underscores, dots and the characters clean_filename() replaces (invalid and
+# control characters) all become word separators; whitespace already is one
+_SEPARATORS = str.maketrans(
+    {char: ' ' for char in '._<>:"/\\|?*' + ''.join(map(chr, range(32)))}
+)
+
+# Title patterns, tried in order at the start of the name by one anchored
+# match (alternation order preserves the old pattern-by-pattern priority):
+# Title.S01E01 / Title S01E01, Title - S01E01, Title (Year), Title.Year
+# Where whitespace may precede the delimiter, the title is written as
+# `[^\S\n]|.*?\S` rather than `.+?`: it matches the same (stripped) titles, but
+# can't end inside a run of whitespace, so long runs aren't rescanned from
+# every position in them.
+_TITLE_RE = re.compile(
+    r'(?P<tv_title>.+?)[\.\s]S(?P<tv_season>\d+)E(?P<tv_episode>\d+)'
+    r'|(?P<tv_dash_title>[^\S\n]|.*?\S)\s*-\s*S(?P<tv_dash_season>\d+)E(?P<tv_dash_episode>\d+)'
+    r'|(?P<paren_title>[^\S\n]|.*?\S)\s*\((?P<paren_year>\d{4})\)'
+    r'|(?P<dot_title>.+?)\.(?P<dot_year>\d{4})',
+    re.IGNORECASE
+)
+# _TITLE_RE lastgroup -> (title, year, season, episode) group names
+_TITLE_GROUPS = {
+    'tv_episode': ('tv_title', None, 'tv_season', 'tv_episode'),
+    'tv_dash_episode': ('tv_dash_title', None, 'tv_dash_season', 'tv_dash_episode'),
+    'paren_year': ('paren_title', 'paren_year', None, None),
+    'dot_year': ('dot_title', 'dot_year', None, None),
+}
+_SEASON_EP_CHECK = re.compile(r's\d+e\d+')
+# Every _TITLE_RE alternative needs a digit (season/episode or year), so a
+# name without one can skip the match entirely
+_DIGIT = re.compile(r'\d')
+
+# Quality/resolution, codec and year detection in a single pass. Each
+# alternative is wrapped in a lookahead so overlapping candidates (e.g. "HD" in
+# "HDivX") are all reported; within each field the lowest tier wins,
+# regardless of position. Years are in a reasonable range (1880-2030) and not
+# part of a longer number like 1080p; no other token starts with one, so the
+# year alternative never hides another.
+_NAME_TOKENS = re.compile(
+    r'(?=(?P<q4k>2160p|4K|UHD)'
+    r'|(?P<q1080>1080p|FHD|FullHD)'
+    r'|(?P<q720>720p|HD)'
+    r'|(?P<q480>480p|SD)'
+    r'|(?P<cHEVC>\bHEVC\b|\bx265\b|H\.265)'
+    r'|(?P<cAVC>\bAVC\b|\bx264\b|H\.264)'
+    r'|(?P<cXVID>\bXVID\b|DivX)'
+    r'|(?P<year>(?<!\d)(?:19[89]\d|20[0-2]\d|2030)(?!\d)))',
+    re.IGNORECASE
+)
+# _NAME_TOKENS group name -> (info field, tier, value); lower tier takes
+# precedence ('year' is handled separately)
+_NAME_TOKEN_GROUPS = {
+    'q4k': ('quality', 0, '4K'),
+    'q1080': ('quality', 1, '1080p'),
+    'q720': ('quality', 2, '720p'),
+    'q480': ('quality', 3, '480p'),
+    'cHEVC': ('codec', 0, 'HEVC'),
+    'cAVC': ('codec', 1, 'AVC'),
+    'cXVID': ('codec', 2, 'XVID'),
+}
+
+# Names that indicate extras rather than a main movie file
+_NON_MOVIE_RE = re.compile(
+    r'sample|trailer|preview|intro|outro|behind.the.scenes|blooper|featurette'
+    r'|deleted.scene|alternate.ending'
+)
+
+# Sample-related keywords in (lowercased) filenames
+_SAMPLE_RE = re.compile(r'\bsample\b|\btrailer\b|\bpreview\b|^sample|sample\.|-sample')
+
+# Media type folders created under the output directory
+_MEDIA_CATEGORIES = ('movies', 'tv_shows', 'music', 'photos')
+
+# Extensions used when deciding which files travel with a main media file
+_VIDEO_EXTS = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm')
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif'})
+_METADATA_EXTS = frozenset({'.nfo', '.xml', '.txt'})
+_SUBTITLE_EXTS = frozenset({'.srt', '.vtt', '.ass', '.ssa', '.sub', '.idx'})
+# Images plus .nfo/.xml, matched more leniently in find_associated_files
+_IMAGE_METADATA_EXTS = _IMAGE_EXTS | {'.nfo', '.xml'}
+
+# Source directory names that end structure preservation for unorganized files
+_GENERIC_DIR_NAMES = frozenset({'downloads', 'desktop', 'documents', 'videos', 'pictures', 'music', 'photos'})
+# Output structure names never preserved from a source path
+_OUTPUT_STRUCTURE_NAMES = frozenset({
+    'organized_media', 'organized.media',
+    'movies', 'tv_shows', 'tv.shows',
+    'unorganized', 'unorganized_files',
+    'organized_files',
+})
+
+# Source directory names never carried over under a category-specific
+# unorganized folder, per media type
+_UNORGANIZED_SKIP_COMMON = frozenset({
+    'downloads', 'desktop', 'organized_media', 'organized.media', 'unorganized', 'unorganized_files',
+})
+_UNORGANIZED_SKIP_NAMES = {
+    'movies': _UNORGANIZED_SKIP_COMMON | {'videos', 'movies', 'tv_shows', 'music', 'photos'},
+    'tv_shows': _UNORGANIZED_SKIP_COMMON | {'videos', 'tv_shows', 'music', 'photos'},
+    'music': _UNORGANIZED_SKIP_COMMON | {'music', 'movies', 'tv_shows', 'photos'},
+    'photos': _UNORGANIZED_SKIP_COMMON | {'pictures', 'photos', 'movies', 'tv_shows', 'music'},
+}
+
+# Junk file/directory names moved to unorganized_files by the output cleanup
+_UNORGANIZED_FILE_NAMES = frozenset({'thumbs.db', '.ds_store', 'desktop.ini', 'folder.jpg'})
+_UNORGANIZED_DIR_NAMES = frozenset({'__pycache__', '.git', '.svn', '.cache'})
+
+# Common associated artwork names (e.g. "Movie Name-poster.jpg")
+_COMMON_ASSOC_RE = re.compile(r'poster|fanart|banner|logo|clearart|thumb|backdrop')
+
+
+class PatternInfo(NamedTuple):
+    """Information parsed from a media filename (see FileOrganizer.extract_pattern_info)."""
+    title: str = ''
+    year: str = ''
+    season: str = ''
+    episode: str = ''
+    quality: str = ''
+    codec: str = ''
+    
+    def get(self, key: str, default=None):
+        """Dict-style lookup, so a PatternInfo can be passed where a pattern info dict is expected."""
+        return getattr(self, key) if key in self._fields else default
+
+
+class FileMapping(NamedTuple):
+    """Original and new path of a moved file, as strings (see FileOrganizer._save_original_structure)."""
+    source: str
+    target: str
+
+
+@lru_cache(maxsize=4096)
+def _parse_pattern_info(filename: str) -> PatternInfo:
+    """
+    Parse a filename into pattern information (cached per filename, with
+    interned field values).
+    
+    Args:
+        filename: Filename to analyze
+    
+    Returns:
+        Immutable PatternInfo
+    """
+    info = dict.fromkeys(PatternInfo._fields, '')
+    
+    # Quality/resolution, codec and first year (one scan of the filename)
+    best_tiers = {}
+    year_match = None
+    for match in _NAME_TOKENS.finditer(filename):
+        group = match.lastgroup
+        if group == 'year':
+            if year_match is None:
+                year_match = match
+            continue
+        field, tier, value = _NAME_TOKEN_GROUPS[group]
+        if tier < best_tiers.get(field, len(_NAME_TOKEN_GROUPS)):
+            best_tiers[field] = tier
+            info[field] = value
+    
+    # TV show or movie title pattern at the start of the name (single match)
+    match = _TITLE_RE.match(filename) if _DIGIT.search(filename) else None
+    if match:
+        title_group, year_group, season_group, episode_group = _TITLE_GROUPS[match.lastgroup]
+        title = match.group(title_group).strip()
+        if season_group:
+            # Clean up TV title if it ends with dash (the title is stripped)
+            if title.endswith('-'):
+                title = title[:-1].rstrip()
+            info['season'] = match.group(season_group)
+            info['episode'] = match.group(episode_group)
+        else:
+            info['year'] = match.group(year_group)
+        info['title'] = title
+    elif year_match:
+        # Otherwise use the first year anywhere in the filename (but not in
+        # quality like 1080p), with the title before it
+        info['year'] = year_match.group('year')
+        title_part = filename[:year_match.start()].strip()
+        if title_part:
+            info['title'] = title_part
+    
+    # Titles, years and numbers repeat across a library (every episode of a
+    # show), so cached results share one string object per distinct value
+    return PatternInfo(**{field: sys.intern(value) for field, value in info.items()})
+
+
+def _split_file_name(name: str) -> Tuple[str, str]:
+    """
+    Split a bare file name into stem and lowercased extension, like Path.stem
+    and get_file_extension() (a leading or trailing dot starts no extension).
+    
+    Args:
+        name: File name without directories
+    
+    Returns:
+        Tuple of (stem, extension)
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:].lower()
+    return name, ''
+
+
+def _plan_file_group(organizer: 'FileOrganizer', file_paths: List[Path],
+                     target_base_dir: Optional[Path]) -> List[Dict]:
+    """
+    Plan moves for a group of files (process pool worker entry point).
+    
+    Args:
+        organizer: Organizer to plan with (pickled into the worker)
+        file_paths: Files to plan, typically sharing a parent directory
+        target_base_dir: Base target directory (None to use config)
+    
+    Returns:
+        List of move plans, in the same order as file_paths
+    """
+    return [organizer.plan_file_move(file_path, target_base_dir) for file_path in file_paths]
+
+
+def _exclusion_checker(exclude_paths) -> Callable[[Path], bool]:
+    """
+    Build a memoized test for "path is an excluded path or inside one".
+    
+    Same answer as trying path.relative_to() against every excluded path,
+    but done as string prefix checks and cached per path, since the cleanup
+    walks test the same ancestors over and over.
+    
+    Args:
+        exclude_paths: Paths to exclude (their subtrees are excluded too)
+    
+    Returns:
+        Function taking a path (Path or str) and returning True if it is excluded
+    """
+    exclude_strs = frozenset(os.path.normcase(str(path)) for path in exclude_paths)
+    exclude_prefixes = tuple(
+        exclude if exclude.endswith(os.sep) else exclude + os.sep
+        for exclude in exclude_strs if exclude != os.curdir
+    )
+    # Path('.') contains every relative path
+    exclude_relative = os.curdir in exclude_strs
+    
+    @lru_cache(maxsize=4096)
+    def is_excluded(path_str: str) -> bool:
+        path_str = os.path.normcase(path_str)
+        if path_str in exclude_strs or path_str.startswith(exclude_prefixes):
+            return True
+        return exclude_relative and not os.path.isabs(path_str)
+    
+    return lambda path: is_excluded(str(path))
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """
+    Check whether a path is a directory or lies inside it, by string prefix.
+    
+    Same answer as `directory == path or directory in path.parents` for
+    normalized paths, without building Path objects or parent chains.
+    
+    Args:
+        path: Path string to test
+        directory: Directory path string
+    
+    Returns:
+        True if path equals directory or is contained in it
+    """
+    if path == directory:
+        return True
+    prefix = directory if directory.endswith(os.sep) else directory + os.sep
+    return path.startswith(prefix)
+
+
+# Directory-relative removal (openat/unlinkat) for the recursive cleanup,
+# where the platform supports it
+_DIR_FD_SUPPORTED = (
+    os.open in os.supports_dir_fd and os.rmdir in os.supports_dir_fd and
+    os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+
+
+# Debug descriptions of rmdir() failures in the empty-directory cleanup
+_RMDIR_ERRNO_MSG = {
+    errno.ENOTEMPTY: "is not empty (ENOTEMPTY)",
+    errno.EEXIST: "is not empty (EEXIST)",
+    errno.EBUSY: "is busy (EBUSY)",
+    errno.EACCES: "cannot be removed, permission denied (EACCES)",
+}
+
+
+def _rmdir_at(directory: Path, parent_fd: Optional[int] = None) -> None:
+    """
+    Remove an empty directory, relative to its parent's descriptor if given.
+    
+    Args:
+        directory: Directory to remove
+        parent_fd: Open descriptor of the parent directory, or None
+    """
+    if parent_fd is None:
+        directory.rmdir()
+    else:
+        os.rmdir(directory.name, dir_fd=parent_fd)
+
+
+class _SweepFrame:
+    """A directory whose subdirectories are being swept by the empty-directory cleanup."""
+    __slots__ = ('directory', 'parent_fd', 'dir_fd', 'subdirs', 'removed')
+    
+    def __init__(self, directory: Path, parent_fd: Optional[int], dir_fd: Optional[int], subdirs: List[str]):
+        self.directory = directory
+        self.parent_fd = parent_fd
+        self.dir_fd = dir_fd
+        self.subdirs = iter(subdirs)
+        self.removed = 0
+
+
+def _scandir_entries(path) -> List[os.DirEntry]:
+    """
+    List a directory as DirEntry objects, whose file type comes with the listing.
+    
+    Args:
+        path: Directory to list
+    
+    Returns:
+        List of os.DirEntry objects (a snapshot, safe to modify the directory while iterating)
+    """
+    with os.scandir(path) as entries:
+        return list(entries)
+
+
+def _free_destination(directory: Path, name: str, taken: set) -> Path:
+    """
+    Pick a destination in a directory that doesn't collide with existing entries.
+    
+    Appends _1, _2, ... to the stem until the name is free. Candidates are
+    tested against a snapshot of the directory's names first, so only a
+    name missing from the snapshot costs an exists() check (which also
+    covers case-insensitive filesystems). The chosen name is added to taken.
+    
+    Args:
+        directory: Destination directory
+        name: Preferred file name
+        taken: Names already in the directory (updated in place)
+    
+    Returns:
+        Destination path
+    """
+    candidate = name
+    counter = 1
+    while candidate in taken or (directory / candidate).exists():
+        taken.add(candidate)
+        stem_path = Path(name)
+        candidate = f"{stem_path.stem}_{counter}{stem_path.suffix}"
+        counter += 1
+    taken.add(candidate)
+    return directory / candidate
+
+
+def _entry_names(path) -> set:
+    """
+    Snapshot the names in a directory.
+    
+    Args:
+        path: Directory to list
+    
+    Returns:
+        Set of entry names (empty if there is no such directory)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _merge_into(src: str, dst: str) -> None:
+    """
+    Move the contents of a directory into an existing one, then remove it.
+    
+    The source tree is walked once. Subdirectories that the destination
+    lacks are moved with a single rename; ones it already has are merged
+    into on the way down. Files whose names are taken get a number appended
+    (see _free_destination). Emptied source directories are removed
+    bottom-up afterwards.
+    
+    Args:
+        src: Directory to merge from
+        dst: Existing directory to merge into
+    """
+    visited = []
+    for root, dirs, files in os.walk(src):
+        visited.append(root)
+        rel = os.path.relpath(root, src)
+        dst_root = Path(dst) if rel == os.curdir else Path(dst, rel)
+        taken = _entry_names(dst_root)
+        
+        merged_dirs = []
+        for name in dirs:
+            dir_src = os.path.join(root, name)
+            if (name in taken and not os.path.islink(dir_src)
+                    and os.path.isdir(os.path.join(dst_root, name))):
+                # Merge into the existing directory when the walk descends
+                merged_dirs.append(name)
+            else:
+                shutil.move(dir_src, os.fspath(_free_destination(dst_root, name, taken)))
+        dirs[:] = merged_dirs
+        
+        for name in files:
+            move_file_cross_device(Path(root, name), _free_destination(dst_root, name, taken))
+    
+    # Children come after their parents in visited
+    for root in reversed(visited):
+        try:
+            os.rmdir(root)
+        except OSError:
+            pass
+
+
+def _is_empty_dir(path) -> bool:
+    """
+    Check whether a directory is empty, reading at most one entry.
+    
+    Args:
+        path: Directory to check
+    
+    Returns:
+        True if the directory has no entries (hidden files count as entries)
+    """
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def _walk_category(category_dir: Path, skip_dir: Path
+                   ) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+    """
+    Walk a category folder bottom-up, like os.walk(topdown=False).
+    
+    The category's unorganized folder is skipped, and the path relative to
+    the category is carried down the walk as a plain string instead of being
+    derived from Path objects for every entry.
+    
+    Args:
+        category_dir: Category folder to walk
+        skip_dir: Directory not to descend into (the category's unorganized folder)
+    
+    Yields:
+        (directory, directory relative to the category or '' for the category
+        itself, subdirectory names, file names) tuples
+    """
+    skip_str = str(skip_dir)
+    
+    def walk(directory: str, relative_dir: str):
+        dirs = []
+        files = []
+        walk_into = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        dirs.append(entry.name)
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            walk_into.append(entry.name)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            return
+        
+        for name in walk_into:
+            subdir = os.path.join(directory, name)
+            if subdir != skip_str:
+                yield from walk(subdir, os.path.join(relative_dir, name))
+        
+        yield directory, relative_dir, dirs, files
+    
+    if not category_dir.is_symlink():
+        yield from walk(str(category_dir), '')
+
+
 class FileOrganizer:
     """Organize and standardize file names and directory structure."""
     
@@ -25,6 +517,48 @@ class FileOrganizer:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         
+        # Directories already created by create_directory_structure.
+        # Shared by plan_moves worker threads; set add/lookup are atomic and a
+        # racing duplicate mkdir is harmless (exist_ok=True).
+        self._mkdir_cache = set()
+        
+        # Directory listings used by find_associated_files, keyed by directory.
+        # Entries for directories touched by execute_move are dropped.
+        self._dir_cache = {}
+        
+        # (source dir, target dir) pairs known to be on different devices
+        self._cross_device_dirs = set()
+        
+        # Settings read once per organizer; callers apply config overrides
+        # (e.g. command-line output directories) before constructing it
+        # Extension -> category ('video', 'audio', 'photo'); an extension listed
+        # under several categories keeps the first, matching the old check order
+        self._ext_to_category = {}
+        for category in ('video', 'audio', 'photo'):
+            for ext in config.get(f'advanced.{category}_extensions', []):
+                self._ext_to_category.setdefault(ext.lower(), category)
+        self._organize_by = config.get('organization.organize_by', 'type')
+        self._max_workers = config.get('advanced.max_workers', 4)
+        self._planning_executor = config.get('advanced.planning_executor', 'threads')
+        
+        # Output directories as Path objects: category-specific ones by media
+        # type, and the default used for categories without one
+        output_dirs = config.get('organization.output_directories', {}) or {}
+        self._output_dirs_paths = {
+            media_type: Path(cat_dir) for media_type, cat_dir in output_dirs.items()
+            if cat_dir and cat_dir.strip()
+        }
+        self._category_specific_paths = frozenset(self._output_dirs_paths.values())
+        self._default_output_dir = Path(config.get('organization.output_directory', 'organized_media'))
+        
+        # _detect_media_type results keyed by file name (type depends only on
+        # the name and the configured extensions)
+        self._media_type_cache = {}
+        
+        # Directories files were moved out of, as strings (cheaper to hash
+        # than Paths; wrap in Path when consumed)
+        self._source_directories: Set[str] = set()
+        
     def sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename by removing/replacing problematic characters.
@@ -35,27 +569,27 @@ class FileOrganizer:
         Returns:
             Cleaned filename
         """
-        # Remove common unwanted prefixes/suffixes
-        filename = filename.strip()
-        
-        # Common cleanup patterns
-        patterns = [
-            (r'^\[.*?\]', ''),  # Remove brackets at start
-            (r'\{.*?\}', ''),   # Remove curly braces
-            # Don't remove parentheses yet - they contain year info
-        ]
-        
-        for pattern, replacement in patterns:
-            filename = re.sub(pattern, replacement, filename, flags=re.IGNORECASE)
+        # Remove [Group] and {Group} tags (don't remove parentheses - they
+        # contain year info), then turn every run of separators and invalid
+        # characters into a single space, trimming the ends. Same result as
+        # clean_filename() followed by collapsing runs of [_\s.], in three
+        # C-level passes.
+        return ' '.join(_GROUP_TAGS.sub('', filename).translate(_SEPARATORS).split())
+    
+    def _title_to_dotted(self, title: str) -> str:
+        """
+        Sanitize a title and join its words with dots ("The Matrix" -> "The.Matrix").
         
-        # Clean using existing utility
-        filename = clean_filename(filename)
+        Same result as sanitize_filename() with spaces replaced by dots, but
+        the words are joined with dots directly.
         
-        # Normalize multiple spaces/underscores/dots
-        filename = re.sub(r'[_\s\.]+', ' ', filename)
-        filename = re.sub(r'[\.\s]+$', '', filename)  # Remove trailing dots/spaces
+        Args:
+            title: Title or filename stem
         
-        return filename.strip()
+        Returns:
+            Dot-separated title
+        """
+        return '.'.join(_GROUP_TAGS.sub('', title).translate(_SEPARATORS).split())
     
     def extract_pattern_info(self, filename: str) -> Dict[str, str]:
         """
@@ -67,134 +601,65 @@ class FileOrganizer:
         Returns:
             Dictionary with extracted information
         """
-        info = {
-            'title': '',
-            'year': '',
-            'season': '',
-            'episode': '',
-            'quality': '',
-            'codec': ''
-        }
-        
-        # TV show pattern: Title.S##E## or Title S##E## or Title - S##E##
-        tv_patterns = [
-            r'^(.+?)[\.\s]S(\d+)E(\d+)',  # Title.S01E01 or Title S01E01
-            r'^(.+?)\s*-\s*S(\d+)E(\d+)',  # Title - S01E01
-        ]
-        
-        for tv_pattern in tv_patterns:
-            match = re.match(tv_pattern, filename, re.IGNORECASE)
-            if match:
-                title = match.group(1).strip()
-                # Clean up title if it ends with dash
-                title = re.sub(r'\s*-\s*$', '', title)
-                info['title'] = title
-                info['season'] = match.group(2)
-                info['episode'] = match.group(3)
-                break
-        else:
-            # If no TV pattern found, try movie patterns
-            # Movie pattern: Title (Year) or Title.Year
-            movie_pattern = r'^(.+?)\s*\((\d{4})\)'
-            match = re.match(movie_pattern, filename, re.IGNORECASE)
-            if match:
-                info['title'] = match.group(1).strip()
-                info['year'] = match.group(2)
-            else:
-                # Try pattern without parentheses: Title.Year
-                movie_pattern2 = r'^(.+?)\.(\d{4})'
-                match = re.match(movie_pattern2, filename, re.IGNORECASE)
-                if match:
-                    info['title'] = match.group(1).strip()
-                    info['year'] = match.group(2)
-                else:
-                    # Try to find year anywhere in filename (but not in quality like 1080p)
-                    # Only match years in a reasonable range (1880-2030)
-                    year_match = re.search(r'(?<!\d)(19[89]\d|20[0-2]\d|2030)(?!\d)', filename)
-                    if year_match:
-                        info['year'] = year_match.group(1)
-                        # Extract title before year
-                        title_part = filename[:year_match.start()].strip()
-                        if title_part:
-                            info['title'] = title_part
-        
-        # Quality/resolution detection
-        quality_patterns = [
-            (r'2160p|4K|UHD', '4K'),
-            (r'1080p|FHD|FullHD', '1080p'),
-            (r'720p|HD', '720p'),
-            (r'480p|SD', '480p'),
-        ]
-        
-        for pattern, quality in quality_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                info['quality'] = quality
-                break
-        
-        # Codec detection
-        codec_patterns = [
-            (r'\bHEVC\b|\bx265\b|H\.265', 'HEVC'),
-            (r'\bAVC\b|\bx264\b|H\.264', 'AVC'),
-            (r'\bXVID\b|DivX', 'XVID'),
-        ]
-        
-        for pattern, codec in codec_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                info['codec'] = codec
-                break
-        
-        return info
+        return dict(_parse_pattern_info(filename)._asdict())
     
-    def _detect_media_type(self, file_path: Path) -> tuple:
+    def _detect_media_type(self, file_path: Path, name_lower: str = None) -> tuple:
         """
         Detect media type based on filename patterns and extension.
         Also determines if the file is recognized (has proper pattern) or unorganized.
         
+        Args:
+            file_path: File to check
+            name_lower: Lowercased file name, if the caller already has it
+        
         Returns:
             Tuple of (media_type, is_recognized) where:
             - media_type: 'movies', 'tv_shows', 'music', 'photos'
             - is_recognized: True if file matches known patterns, False if unorganized
         """
-        filename = file_path.name.lower()
-        extension = get_file_extension(file_path).lower()
+        name = file_path.name
+        cached = self._media_type_cache.get(name)
+        if cached is None:
+            cached = self._media_type_cache[name] = self._classify_media_type(
+                file_path, name_lower if name_lower is not None else name.lower()
+            )
+        return cached
+    
+    def _classify_media_type(self, file_path: Path, filename: str) -> tuple:
+        """
+        Uncached implementation of _detect_media_type.
         
-        # Get supported extensions
-        video_exts = self.config.get('advanced.video_extensions', [])
-        audio_exts = self.config.get('advanced.audio_extensions', [])
-        photo_exts = self.config.get('advanced.photo_extensions', [])
+        Args:
+            file_path: File to check
+            filename: Lowercased file name
+        
+        Returns:
+            Tuple of (media_type, is_recognized)
+        """
+        extension = get_file_extension(file_path)
         
         # Check if file has a known media extension
-        is_video = extension in [ext.lower() for ext in video_exts]
-        is_audio = extension in [ext.lower() for ext in audio_exts]
-        is_photo = extension in [ext.lower() for ext in photo_exts]
+        category = self._ext_to_category.get(extension)
         
-        if is_video:
+        if category == 'video':
             # Check for TV show patterns first
-            if re.search(r's\d+e\d+', filename):
-                pattern_info = self.extract_pattern_info(filename)
+            # Parse the original-case name, so the cached parse is shared with
+            # plan_file_move's call
+            pattern_info = _parse_pattern_info(file_path.name)
+            
+            if _SEASON_EP_CHECK.search(filename):
                 # TV shows with season/episode are recognized
-                is_recognized = bool(pattern_info.get('season') and pattern_info.get('episode'))
+                is_recognized = bool(pattern_info.season and pattern_info.episode)
                 return ('tv_shows', is_recognized)
             
-            # Check if it could be a movie based on pattern
-            pattern_info = self.extract_pattern_info(filename)
-            
             # If it has a clear movie/year pattern, it's a recognized movie
-            if pattern_info.get('year'):
+            if pattern_info.year:
                 return ('movies', True)
             
             # If it has a title that looks like a movie name, it's a recognized movie
-            if pattern_info.get('title') and len(pattern_info['title']) > 2:
+            if pattern_info.title and len(pattern_info.title) > 2:
                 # Check for common non-movie indicators
-                non_movie_patterns = [
-                    r'sample', r'trailer', r'preview', r'intro', r'outro',
-                    r'behind.the.scenes', r'blooper', r'featurette',
-                    r'deleted.scene', r'alternate.ending'
-                ]
-                
-                has_non_movie_pattern = any(
-                    re.search(pattern, filename) for pattern in non_movie_patterns
-                )
+                has_non_movie_pattern = _NON_MOVIE_RE.search(filename) is not None
                 
                 if not has_non_movie_pattern:
                     return ('movies', True)
@@ -202,10 +667,10 @@ class FileOrganizer:
             # Video file but doesn't match patterns - goes to movies/unorganized
             return ('movies', False)
         
-        elif is_audio:
+        elif category == 'audio':
             # Audio files go to music (no pattern matching for now, so all are unorganized)
             return ('music', False)
-        elif is_photo:
+        elif category == 'photo':
             # Photo files go to photos (no pattern matching for now, so all are unorganized)
             return ('photos', False)
         else:
@@ -213,149 +678,158 @@ class FileOrganizer:
             # Or we could skip it, but let's put it somewhere
             return ('movies', False)
     
-    def generate_new_filename(self, file_path: Path, pattern_info: Dict = None, media_type: str = None) -> str:
+    def generate_new_filename(self, file_path: Union[Path, str], pattern_info: Dict = None,
+                              media_type: str = None) -> str:
         """
         Generate a new standardized filename.
         Format: Movie.Title.Year.FileType or Show.Title.S01E01.FileType
         
         Args:
-            file_path: Path to file
-            pattern_info: Extracted pattern information
+            file_path: Path to file, or a bare file name (split without building a Path)
+            pattern_info: Extracted pattern information (dict or PatternInfo)
             media_type: Type of media to determine naming strategy
         
         Returns:
             New filename (without path)
         """
-        if pattern_info is None:
-            pattern_info = self.extract_pattern_info(file_path.stem)
-        
-        extension = get_file_extension(file_path)
-        
-        # Get configuration
-        naming_pattern = self.config.get('organization.naming_pattern', '{title} ({year}) [{resolution}]')
+        if isinstance(file_path, str):
+            stem, extension = _split_file_name(file_path)
+        else:
+            stem, extension = file_path.stem, get_file_extension(file_path)
         
-        # Build components for dot-separated format
-        components = []
+        if pattern_info is None:
+            pattern_info = self.extract_pattern_info(stem)
         
         # Title - replace spaces with dots
         title = pattern_info.get('title', '')
         if not title:
             # For unorganized files without a recognized title, use original stem (sanitized)
-            title = self.sanitize_filename(file_path.stem)
-            title = re.sub(r'\s+', '.', title)
-            components.append(title)
-            # Join with dots and clean
-            new_name = '.'.join(components) if components else file_path.stem
-            new_name = clean_filename(new_name)
-            return new_name + extension
-        
-        # Clean title and replace spaces with dots
-        title = self.sanitize_filename(title)
-        title = re.sub(r'\s+', '.', title)
-        components.append(title)
-        
-        # Year
-        if pattern_info.get('year'):
-            components.append(pattern_info['year'])
+            return self._title_to_dotted(stem) + extension
         
-        # Season/Episode for TV shows
-        if pattern_info.get('season') and pattern_info.get('episode'):
-            components.append(f"S{pattern_info['season']}E{pattern_info['episode']}")
+        # Year, and Season/Episode for TV shows
+        year = pattern_info.get('year')
+        season = pattern_info.get('season')
+        episode = pattern_info.get('episode')
+        season_episode = f"S{season}E{episode}" if season and episode else ''
         
-        # Join with dots: Title.Year or Title.S01E01
-        new_name = '.'.join(components) if components else file_path.stem
-        
-        # Remove any leftover problematic characters
-        new_name = clean_filename(new_name)
+        # Join the non-empty parts with dots in one step: Title.Year or
+        # Title.S01E01. The dotted title is already free of invalid characters
+        # and outer dots, and the other parts are digits, so the result needs
+        # no clean_filename() pass (an empty title is simply left out).
+        new_name = '.'.join(filter(None, (self._title_to_dotted(title), year, season_episode)))
         
         return new_name + extension
     
-    def _is_sample_or_junk_file(self, file_path: Path) -> bool:
+    def _is_sample_or_junk_file(self, file_path: Path, file_size: Optional[int] = None) -> bool:
         """
         Determine if a file is a sample or junk file that should not be moved with the main movie.
         
         Args:
             file_path: File to check
+            file_size: Size of the file in bytes, if the caller already has it
         
         Returns:
             True if file is sample/junk, False otherwise
         """
-        if not file_path.exists():
-            return False
+        if file_size is None:
+            # A single stat both checks that the file exists and gets its size
+            try:
+                file_size = get_file_size(file_path, file_path.stat())
+            except (OSError, IOError):
+                return False
         
         filename_lower = file_path.name.lower()
         
-        try:
-            file_size = get_file_size(file_path)
-        except (OSError, IOError):
+        # Only video files are treated as samples
+        if not filename_lower.endswith(_VIDEO_EXTS):
             return False
         
-        # Check for sample indicators in filename
-        sample_patterns = [
-            r'\bsample\b',
-            r'\btrailer\b',
-            r'\bpreview\b',
-            r'^sample',
-            r'sample\.',
-            r'-sample',
-        ]
-        
-        # Check if filename contains sample-related keywords
-        is_sample_name = any(re.search(pattern, filename_lower) for pattern in sample_patterns)
-        
-        # Small video files (< 50MB) with sample-like names are likely samples
-        if is_sample_name:
-            video_exts = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']
-            if any(file_path.name.lower().endswith(ext) for ext in video_exts):
-                if file_size < 50 * 1024 * 1024:  # Less than 50MB
-                    return True
-        
         # Very small video files (< 10MB) are likely samples regardless of name
-        video_exts = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']
-        if any(file_path.name.lower().endswith(ext) for ext in video_exts):
-            if file_size < 10 * 1024 * 1024:  # Less than 10MB
-                return True
+        if file_size < 10 * 1024 * 1024:  # Less than 10MB
+            return True
+        
+        # Small video files (< 50MB) with sample-related keywords are likely samples
+        if file_size < 50 * 1024 * 1024:  # Less than 50MB
+            return _SAMPLE_RE.search(filename_lower) is not None
         
         return False
     
-    def _should_keep_with_main_file(self, file_path: Path) -> bool:
+    def _should_keep_with_main_file(self, file_path: Path, file_size: Optional[int] = None) -> bool:
         """
         Determine if an associated file should be kept with the main movie file.
         Always keep images, metadata, and subtitles. When in doubt, keep files together.
         
         Args:
             file_path: Associated file to check
+            file_size: Size of the file in bytes, if the caller already has it
         
         Returns:
             True if file should be kept with main file, False otherwise
         """
-        extension = get_file_extension(file_path).lower()
-        filename_lower = file_path.name.lower()
+        extension = get_file_extension(file_path)
         
         # Always keep images with main file
-        image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif']
-        if extension in image_exts:
+        if extension in _IMAGE_EXTS:
             return True
         
         # Always keep metadata files with main file
-        metadata_exts = ['.nfo', '.xml', '.txt']
-        if extension in metadata_exts:
+        if extension in _METADATA_EXTS:
             return True
         
         # Always keep subtitle files with main file
-        subtitle_exts = ['.srt', '.vtt', '.ass', '.ssa', '.sub', '.idx']
-        if extension in subtitle_exts:
+        if extension in _SUBTITLE_EXTS:
             return True
         
         # For other files, check if they're samples/junk
         # If it's clearly a sample/junk, don't move it with the main file
-        if self._is_sample_or_junk_file(file_path):
+        if self._is_sample_or_junk_file(file_path, file_size):
             return False
         
         # When in doubt (unknown file type, not clearly junk), keep with main file
         # This is the conservative approach the user requested
         return True
     
+    def _list_directory_files(self, directory: Path) -> List[Tuple[str, str, str, int]]:
+        """
+        List the regular files in a directory, scanning each directory once.
+        
+        Results are cached so that planning many files from the same directory
+        does not re-scan it for every file; see clear_dir_cache().
+        
+        Args:
+            directory: Directory to list
+        
+        Returns:
+            List of (name, lowercased stem, lowercased extension, size) tuples
+        """
+        files = self._dir_cache.get(directory)
+        if files is not None:
+            return files
+        
+        files = []
+        # scandir entries carry the file type, so only regular files are stat'ed
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    file_size = entry.stat().st_size
+                except OSError:
+                    continue
+                entry_path = Path(entry.name)
+                files.append((entry.name, entry_path.stem.lower(), get_file_extension(entry_path), file_size))
+        
+        self._dir_cache[directory] = files
+        return files
+    
+    def clear_dir_cache(self) -> None:
+        """
+        Forget cached directory listings and created target directories (call
+        after files have been moved or directories removed).
+        """
+        self._dir_cache.clear()
+        self._mkdir_cache.clear()
+    
     def find_associated_files(self, file_path: Path) -> List[Path]:
         """
         Find files associated with this media file.
@@ -371,50 +845,46 @@ class FileOrganizer:
         associated = []
         directory = file_path.parent
         
-        # Get the main file's base name (without extension)
+        # Get the main file's base name (without extension), plus the
+        # derived prefixes used for every sibling
         main_base = file_path.stem.lower()
-        
-        # Common associated file patterns (poster, fanart, etc.)
-        common_patterns = ['poster', 'fanart', 'banner', 'logo', 'clearart', 'thumb', 'backdrop']
+        main_base_prefixes = (main_base + '-', main_base + '_', main_base + '.')
+        main_base_head = main_base[:10]
         
         # Look for files in the same directory that might be associated
-        for potential_file in directory.iterdir():
-            if potential_file == file_path or not potential_file.is_file():
-                continue
-            
-            potential_base = potential_file.stem.lower()
-            extension = get_file_extension(potential_file).lower()
-            
-            # Always check if file should be kept first (fast check for images/metadata)
-            if not self._should_keep_with_main_file(potential_file):
+        for name, potential_base, extension, file_size in self._list_directory_files(directory):
+            if name == file_path.name:
                 continue
             
             # Check if file has same base name (exact match or variations)
             is_similar_name = (
                 potential_base == main_base or
-                potential_base.startswith(main_base + '-') or
-                potential_base.startswith(main_base + '_') or
-                potential_base.startswith(main_base + '.') or
+                potential_base.startswith(main_base_prefixes) or
                 main_base.startswith(potential_base)
             )
             
             # Also check for common associated file naming patterns
             # e.g., "Movie Name-poster.jpg" or "Movie Name.fanart.jpg"
-            is_common_pattern = any(
-                pattern in potential_base and (main_base in potential_base or potential_base in main_base)
-                for pattern in common_patterns
+            is_common_pattern = (
+                not is_similar_name and
+                (main_base in potential_base or potential_base in main_base) and
+                _COMMON_ASSOC_RE.search(potential_base) is not None
             )
             
             # For images and metadata in the same directory, be more lenient
             # If it's an image or metadata file, assume it's associated if name overlaps
-            is_image_or_metadata = extension in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.nfo', '.xml']
             is_directory_match = (
-                is_image_or_metadata and
-                (potential_base.startswith(main_base[:10]) or main_base.startswith(potential_base[:10]))
+                extension in _IMAGE_METADATA_EXTS and
+                (potential_base.startswith(main_base_head) or main_base.startswith(potential_base[:10]))
             )
             
-            # Include if it matches any of these criteria
-            if is_similar_name or is_common_pattern or is_directory_match:
+            # Skip unrelated names before any sample detection
+            if not (is_similar_name or is_common_pattern or is_directory_match):
+                continue
+            
+            # Only keep files that belong with the main file (not samples/junk)
+            potential_file = directory / name
+            if self._should_keep_with_main_file(potential_file, file_size):
                 associated.append(potential_file)
         
         return associated
@@ -430,26 +900,20 @@ class FileOrganizer:
         Returns:
             Dictionary with move plan information
         """
+        name = file_path.name
+        name_lower = name.lower()
+        
         # Determine media type and whether it's recognized
-        media_type, is_recognized = self._detect_media_type(file_path)
+        media_type, is_recognized = self._detect_media_type(file_path, name_lower)
         
-        # Extract info
-        pattern_info = self.extract_pattern_info(file_path.name)
+        # Extract info (immutable and cached; no per-file dict)
+        pattern_info = _parse_pattern_info(name)
         new_name = self.generate_new_filename(file_path, pattern_info, media_type)
         
         # Determine target base directory
         if target_base_dir is None:
-            # Check for category-specific output directory
-            output_dirs = self.config.get('organization.output_directories', {})
-            category_dir = output_dirs.get(media_type, '')
-            
-            if category_dir and category_dir.strip():
-                # Use category-specific directory
-                target_base_dir = Path(category_dir)
-            else:
-                # Use default output directory
-                output_dir = self.config.get('organization.output_directory', 'organized_media')
-                target_base_dir = Path(output_dir)
+            # Use the category-specific output directory, or the default one
+            target_base_dir = self._output_dirs_paths.get(media_type) or self._default_output_dir
         
         # Create organized directory structure
         target_dir = self.create_directory_structure(target_base_dir, media_type, pattern_info, is_recognized, file_path)
@@ -469,6 +933,8 @@ class FileOrganizer:
                     'file': file_path,
                     'from': file_path,
                     'to': new_path,
+                    'from_str': str(file_path),
+                    'to_str': str(new_path),
                     'associated': [],
                     'changed': False,
                     'media_type': media_type,
@@ -484,7 +950,7 @@ class FileOrganizer:
                 target_category_dir = target_dir
                 
                 # If file is already in the target directory, check if it should stay
-                if current_parent == target_category_dir or target_category_dir in current_parent.parents:
+                if _is_within(str(current_parent), str(target_category_dir)):
                     # File is already in the target category directory structure
                     # Check if it should be in unorganized but is already in unorganized
                     if not is_recognized and 'unorganized' in current_parent.parts:
@@ -504,6 +970,8 @@ class FileOrganizer:
                                     'file': file_path,
                                     'from': file_path,
                                     'to': new_path,
+                                    'from_str': str(file_path),
+                                    'to_str': str(new_path),
                                     'associated': [],
                                     'changed': False,
                                     'media_type': media_type,
@@ -519,6 +987,8 @@ class FileOrganizer:
                                 'file': file_path,
                                 'from': file_path,
                                 'to': new_path,
+                                'from_str': str(file_path),
+                                'to_str': str(new_path),
                                 'associated': [],
                                 'changed': False,
                                 'media_type': media_type,
@@ -546,20 +1016,98 @@ class FileOrganizer:
             assoc_new_path = target_dir / sanitized_name
             associated_moves.append({
                 'from': assoc_file,
-                'to': assoc_new_path
+                'to': assoc_new_path,
+                'from_str': str(assoc_file),
+                'to_str': str(assoc_new_path)
             })
         
+        # Plans carry their paths as strings too, formatted once here for
+        # logging, mappings and plan files instead of on every use
         return {
             'file': file_path,
             'from': file_path,
             'to': new_path,
+            'from_str': str(file_path),
+            'to_str': str(new_path),
             'associated': associated_moves,
-            'changed': str(file_path) != str(new_path),
+            'changed': file_path != new_path,
             'media_type': media_type,
             'is_recognized': is_recognized,
             'target_dir': target_dir
         }
     
+    def plan_moves(self, file_paths: List[Path], target_base_dir: Path = None,
+                   progress_bar=None) -> List[Dict]:
+        """
+        Plan moves for multiple files in parallel.
+        
+        Planning is dominated by filesystem calls (stat, directory listing,
+        mkdir), so by default it is spread across a thread pool. With
+        advanced.planning_executor set to "processes", files are grouped by
+        parent directory and each group is planned in a worker process,
+        which also parallelizes the CPU-bound filename parsing.
+        
+        Args:
+            file_paths: List of file paths to plan
+            target_base_dir: Base target directory (None to use config)
+            progress_bar: Optional progress bar to update
+        
+        Returns:
+            List of move plans, in the same order as file_paths
+        """
+        if self._planning_executor == 'processes':
+            return self._plan_moves_in_processes(file_paths, target_base_dir, progress_bar)
+        
+        plans = []
+        
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = executor.map(
+                lambda file_path: self.plan_file_move(file_path, target_base_dir),
+                file_paths
+            )
+            for move_plan in results:
+                plans.append(move_plan)
+                if progress_bar is not None:
+                    progress_bar.update(1)
+        
+        return plans
+    
+    def _plan_moves_in_processes(self, file_paths: List[Path], target_base_dir: Path = None,
+                                 progress_bar=None) -> List[Dict]:
+        """
+        Plan moves in a process pool, one task per source directory.
+        
+        Args:
+            file_paths: List of file paths to plan
+            target_base_dir: Base target directory (None to use config)
+            progress_bar: Optional progress bar to update
+        
+        Returns:
+            List of move plans, in the same order as file_paths
+        """
+        # Group positions by parent directory so siblings are planned together
+        groups = {}
+        for index, file_path in enumerate(file_paths):
+            groups.setdefault(file_path.parent, []).append(index)
+        
+        plans = [None] * len(file_paths)
+        
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _plan_file_group, self, [file_paths[i] for i in indices], target_base_dir
+                ): indices
+                for indices in groups.values()
+            }
+            for future in as_completed(futures):
+                indices = futures[future]
+                for index, move_plan in zip(indices, future.result()):
+                    plans[index] = move_plan
+                if progress_bar is not None:
+                    progress_bar.update(len(indices))
+        
+        return plans
+    
     def _preserve_unorganized_structure(self, file_path: Path, base_path: Path, media_type: str) -> Path:
         """
         For unorganized files, preserve some of the original directory structure
@@ -576,22 +1124,12 @@ class FileOrganizer:
         # For unorganized files, preserve the last 2-3 levels of directory structure
         # This keeps files from the same source together
         try:
-            # Get relative parts of the original path
-            source_parts = file_path.parent.parts
+            # Last 3 components of the original directory (plain string split;
+            # a leading root shows up as '' rather than '/', and is skipped)
+            source_parts = str(file_path.parent).split(os.sep)[-3:]
             
             # Get the output directory structure to avoid preserving it
-            output_dir = self.config.get('organization.output_directory', 'organized_media')
-            output_path = Path(output_dir)
-            
-            # Skip parts that match the output structure
-            # Also skip generic names and output structure names
-            generic_names = {'downloads', 'desktop', 'documents', 'videos', 'pictures', 'music', 'photos'}
-            output_structure_names = {
-                'organized_media', 'organized.media',
-                'movies', 'tv_shows', 'tv.shows', 'tv_shows',
-                'unorganized', 'unorganized_files',
-                'organized_files'
-            }
+            output_path = self._default_output_dir
             
             # Normalize base_path for comparison
             base_parts_lower = {bp.lower() for bp in base_path.parts}
@@ -604,32 +1142,31 @@ class FileOrganizer:
                 output_path_normalized = output_path.resolve()
                 
                 # If file is already within output directory, don't preserve structure
-                try:
-                    relative_to_output = file_path_normalized.relative_to(output_path_normalized)
+                file_str = str(file_path_normalized)
+                output_str = str(output_path_normalized)
+                if file_str != output_str and _is_within(file_str, output_str):
                     # File is in output directory - check if it's in an organized structure
-                    relative_parts = relative_to_output.parts
-                    if len(relative_parts) > 0:
-                        # If file is in movies/, tv_shows/, etc., don't preserve structure
-                        if relative_parts[0] in ['movies', 'tv_shows', 'music', 'photos']:
-                            # Already in organized structure, just use simple unorganized path
-                            return base_path / media_type / 'unorganized'
-                except ValueError:
-                    # File is not within output directory, can preserve structure
-                    pass
+                    output_prefix_len = len(output_str) if output_str.endswith(os.sep) else len(output_str) + 1
+                    first_part = file_str[output_prefix_len:].split(os.sep, 1)[0]
+                    # If file is in movies/, tv_shows/, etc., don't preserve structure
+                    if first_part in _MEDIA_CATEGORIES:
+                        # Already in organized structure, just use simple unorganized path
+                        return base_path / media_type / 'unorganized'
             except (OSError, ValueError):
                 # Can't determine, continue with preservation logic
                 pass
             
+            # Collected deepest-first, reversed afterwards
             preserved_parts = []
-            for part in reversed(source_parts[-3:]):  # Take last 3 levels
+            for part in reversed(source_parts):  # Take last 3 levels
                 part_lower = part.lower()
                 
                 # Skip if it's a generic name
-                if part_lower in generic_names:
+                if part_lower in _GENERIC_DIR_NAMES:
                     break
                 
                 # Skip if it matches output structure
-                if (part_lower in output_structure_names or 
+                if (part_lower in _OUTPUT_STRUCTURE_NAMES or 
                     part_lower in base_parts_lower or 
                     part_lower in output_parts_lower):
                     continue
@@ -640,14 +1177,16 @@ class FileOrganizer:
                 
                 # Only preserve meaningful directory names
                 if len(part) > 2:
-                    preserved_parts.insert(0, part)
+                    preserved_parts.append(part)
                 else:
                     break
+            preserved_parts.reverse()
             
             # If we have preserved parts, create structure
             if preserved_parts:
                 # Sanitize directory names
-                sanitized_parts = [self.sanitize_filename(part) for part in preserved_parts]
+                sanitize = self.sanitize_filename
+                sanitized_parts = [sanitize(part) for part in preserved_parts]
                 sanitized_parts = [part.replace(' ', '.') for part in sanitized_parts if part]
                 
                 if sanitized_parts:
@@ -663,6 +1202,50 @@ class FileOrganizer:
         # Default: just use unorganized folder
         return base_path / media_type / 'unorganized'
     
+    def _unorganized_target(self, base_path: Path, new_path: Path, media_type: str,
+                            file_path: Optional[Path], is_category_specific: bool) -> Path:
+        """
+        Determine the target directory for an unrecognized file, preserving some
+        of its source directory structure to keep related files together.
+        
+        Args:
+            base_path: Base directory (may already be category-specific)
+            new_path: Directory built so far for this media type
+            media_type: Type of media
+            file_path: Original file path (None if unknown)
+            is_category_specific: Whether base_path is a category-specific directory
+        
+        Returns:
+            Target directory under the media type's unorganized folder
+        """
+        if not file_path:
+            return new_path / 'unorganized'
+        
+        if not is_category_specific:
+            return self._preserve_unorganized_structure(file_path, base_path, media_type)
+        
+        # Already at category-specific path, just add unorganized
+        new_path = new_path / 'unorganized'
+        # Try to preserve structure from file_path, but skip output structure names
+        try:
+            # The media type and unorganized folder names are already in skip_names
+            skip_names = _UNORGANIZED_SKIP_NAMES[media_type]
+            base_name = base_path.name.lower()
+            sanitize = self.sanitize_filename
+            
+            for part in str(file_path.parent).split(os.sep)[-2:]:  # Last 2 levels
+                part_lower = part.lower()
+                # Skip if it matches output structure
+                if (len(part) > 2 and
+                    part_lower not in skip_names and
+                    part_lower != base_name):
+                    sanitized = sanitize(part).replace(' ', '.')
+                    new_path = new_path / sanitized
+        except Exception:
+            pass
+        
+        return new_path
+    
     def create_directory_structure(self, base_path: Path, media_type: str = None, pattern_info: Dict = None, is_recognized: bool = True, file_path: Path = None) -> Path:
         """
         Create organized directory structure.
@@ -670,7 +1253,7 @@ class FileOrganizer:
         Args:
             base_path: Base directory (may already be category-specific)
             media_type: Type of media (movie, tv, music, etc.)
-            pattern_info: Extracted pattern information
+            pattern_info: Extracted pattern information (dict or PatternInfo)
             is_recognized: Whether the file matches known patterns (False = unorganized)
         
         Returns:
@@ -679,7 +1262,7 @@ class FileOrganizer:
         if media_type is None:
             return base_path
         
-        organize_by = self.config.get('organization.organize_by', 'type')
+        organize_by = self._organize_by
         
         if organize_by == 'none':
             return base_path
@@ -689,12 +1272,7 @@ class FileOrganizer:
         
         # Check if base_path is already a category-specific directory
         # by checking if it matches any configured category directory
-        output_dirs = self.config.get('organization.output_directories', {})
-        is_category_specific = False
-        for category, cat_dir in output_dirs.items():
-            if cat_dir and cat_dir.strip() and str(base_path) == str(Path(cat_dir)):
-                is_category_specific = True
-                break
+        is_category_specific = base_path in self._category_specific_paths
         
         # Only add media_type subdirectory if base_path is not category-specific
         # and organize_by is 'type'
@@ -710,83 +1288,28 @@ class FileOrganizer:
             else:
                 # Unrecognized movies go to movies/unorganized/
                 # Preserve some directory structure to keep files together
-                if file_path:
-                    preserved_path = self._preserve_unorganized_structure(file_path, base_path, media_type)
-                    # Check if base_path is category-specific
-                    output_dirs = self.config.get('organization.output_directories', {})
-                    is_category_specific = any(
-                        cat_dir and cat_dir.strip() and str(base_path) == str(Path(cat_dir))
-                        for cat_dir in output_dirs.values()
-                    )
-                    
-                    if is_category_specific:
-                        # Already at category-specific path, just add unorganized
-                        new_path = new_path / 'unorganized'
-                        # Try to preserve structure from file_path, but skip output structure names
-                        try:
-                            source_parts = file_path.parent.parts[-2:]  # Last 2 levels
-                            output_structure = {base_path.name.lower(), media_type, 'unorganized', 'unorganized_files'}
-                            
-                            if source_parts:
-                                for part in source_parts:
-                                    part_lower = part.lower()
-                                    # Skip if it matches output structure
-                                    if (len(part) > 2 and 
-                                        part_lower not in {'downloads', 'desktop', 'videos', 'movies', 'tv_shows', 'music', 'photos', 'organized_media', 'organized.media', 'unorganized', 'unorganized_files'} and
-                                        part_lower not in output_structure):
-                                        sanitized = self.sanitize_filename(part).replace(' ', '.')
-                                        new_path = new_path / sanitized
-                        except Exception:
-                            pass
-                    else:
-                        new_path = preserved_path
-                else:
-                    new_path = new_path / 'unorganized'
+                new_path = self._unorganized_target(
+                    base_path, new_path, media_type, file_path, is_category_specific
+                )
         
         elif media_type == 'tv_shows':
-            if is_recognized and pattern_info and pattern_info.get('title'):
+            show_title = pattern_info.get('title') if pattern_info else None
+            if is_recognized and show_title:
                 # Organize by show name for recognized TV shows
-                show_name = pattern_info['title']
                 # Clean show name for directory
-                show_name = self.sanitize_filename(show_name)
-                show_name = re.sub(r'\s+', '.', show_name)
+                show_name = self._title_to_dotted(show_title)
                 new_path = new_path / show_name
                 
                 # Add season folder
-                if pattern_info.get('season'):
-                    season = f"Season {pattern_info['season']}"
-                    new_path = new_path / season
+                season = pattern_info.get('season')
+                if season:
+                    new_path = new_path / f"Season {season}"
             else:
                 # Unrecognized TV shows go to tv_shows/unorganized/
                 # Preserve structure to keep files together
-                if file_path:
-                    preserved_path = self._preserve_unorganized_structure(file_path, base_path, media_type)
-                    output_dirs = self.config.get('organization.output_directories', {})
-                    is_category_specific = any(
-                        cat_dir and cat_dir.strip() and str(base_path) == str(Path(cat_dir))
-                        for cat_dir in output_dirs.values()
-                    )
-                    
-                    if is_category_specific:
-                        new_path = new_path / 'unorganized'
-                        try:
-                            source_parts = file_path.parent.parts[-2:]
-                            output_structure = {base_path.name.lower(), media_type, 'unorganized', 'unorganized_files'}
-                            
-                            if source_parts:
-                                for part in source_parts:
-                                    part_lower = part.lower()
-                                    if (len(part) > 2 and 
-                                        part_lower not in {'downloads', 'desktop', 'videos', 'tv_shows', 'music', 'photos', 'organized_media', 'organized.media', 'unorganized', 'unorganized_files'} and
-                                        part_lower not in output_structure):
-                                        sanitized = self.sanitize_filename(part).replace(' ', '.')
-                                        new_path = new_path / sanitized
-                        except Exception:
-                            pass
-                    else:
-                        new_path = preserved_path
-                else:
-                    new_path = new_path / 'unorganized'
+                new_path = self._unorganized_target(
+                    base_path, new_path, media_type, file_path, is_category_specific
+                )
         
         elif media_type == 'music':
             if is_recognized:
@@ -795,34 +1318,9 @@ class FileOrganizer:
             else:
                 # Unrecognized music goes to music/unorganized/
                 # Preserve structure to keep files together
-                if file_path:
-                    preserved_path = self._preserve_unorganized_structure(file_path, base_path, media_type)
-                    output_dirs = self.config.get('organization.output_directories', {})
-                    is_category_specific = any(
-                        cat_dir and cat_dir.strip() and str(base_path) == str(Path(cat_dir))
-                        for cat_dir in output_dirs.values()
-                    )
-                    
-                    if is_category_specific:
-                        new_path = new_path / 'unorganized'
-                        try:
-                            source_parts = file_path.parent.parts[-2:]
-                            output_structure = {base_path.name.lower(), media_type, 'unorganized', 'unorganized_files'}
-                            
-                            if source_parts:
-                                for part in source_parts:
-                                    part_lower = part.lower()
-                                    if (len(part) > 2 and 
-                                        part_lower not in {'downloads', 'desktop', 'music', 'movies', 'tv_shows', 'photos', 'organized_media', 'organized.media', 'unorganized', 'unorganized_files'} and
-                                        part_lower not in output_structure):
-                                        sanitized = self.sanitize_filename(part).replace(' ', '.')
-                                        new_path = new_path / sanitized
-                        except Exception:
-                            pass
-                    else:
-                        new_path = preserved_path
-                else:
-                    new_path = new_path / 'unorganized'
+                new_path = self._unorganized_target(
+                    base_path, new_path, media_type, file_path, is_category_specific
+                )
         
         elif media_type == 'photos':
             if is_recognized:
@@ -831,48 +1329,25 @@ class FileOrganizer:
             else:
                 # Unrecognized photos go to photos/unorganized/
                 # Preserve structure to keep files together
-                if file_path:
-                    preserved_path = self._preserve_unorganized_structure(file_path, base_path, media_type)
-                    output_dirs = self.config.get('organization.output_directories', {})
-                    is_category_specific = any(
-                        cat_dir and cat_dir.strip() and str(base_path) == str(Path(cat_dir))
-                        for cat_dir in output_dirs.values()
-                    )
-                    
-                    if is_category_specific:
-                        new_path = new_path / 'unorganized'
-                        try:
-                            source_parts = file_path.parent.parts[-2:]
-                            output_structure = {base_path.name.lower(), media_type, 'unorganized', 'unorganized_files'}
-                            
-                            if source_parts:
-                                for part in source_parts:
-                                    part_lower = part.lower()
-                                    if (len(part) > 2 and 
-                                        part_lower not in {'downloads', 'desktop', 'pictures', 'photos', 'movies', 'tv_shows', 'music', 'organized_media', 'organized.media', 'unorganized', 'unorganized_files'} and
-                                        part_lower not in output_structure):
-                                        sanitized = self.sanitize_filename(part).replace(' ', '.')
-                                        new_path = new_path / sanitized
-                        except Exception:
-                            pass
-                    else:
-                        new_path = preserved_path
-                else:
-                    new_path = new_path / 'unorganized'
+                new_path = self._unorganized_target(
+                    base_path, new_path, media_type, file_path, is_category_specific
+                )
         
-        # Create directory
-        new_path.mkdir(parents=True, exist_ok=True)
+        # Create directory (once per distinct path)
+        if new_path not in self._mkdir_cache:
+            new_path.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(new_path)
         
         return new_path
     
-    def _save_original_structure(self, target_dir: Path, file_mappings: List[Dict[str, Path]]) -> None:
+    def _save_original_structure(self, target_dir: Path, file_mappings: List[FileMapping]) -> None:
         """
         Save original file structure mapping to a text file for unorganized files.
         Preserves the full original directory structure in a concise format.
         
         Args:
             target_dir: Target directory where files are being moved
-            file_mappings: List of dictionaries with 'from' and 'to' keys
+            file_mappings: List of FileMapping records (original and new path)
         """
         try:
             mapping_file = target_dir / "original_structure.txt"
@@ -880,40 +1355,54 @@ class FileOrganizer:
             # Check if file exists to determine if we need a header
             file_exists = mapping_file.exists()
             
-            # Append new mappings
-            with open(mapping_file, 'a', encoding='utf-8') as f:
+            # Group by original directory structure: split each mapping's path
+            # strings with os.path, so sorting and grouping compare plain
+            # strings and no parent Path objects are created
+            entries = []
+            for source, target in file_mappings:
+                entries.append((os.path.dirname(source) or os.curdir, source,
+                                os.path.basename(source), os.path.basename(target)))
+            entries.sort()
+            
+            # Build the whole block first and append it with a single write
+            out = []
+            if not file_exists:
                 # Add timestamp header if file is new
-                if not file_exists:
-                    f.write(f"Original File Structure Mapping\n")
-                    f.write(f"Generated: {datetime.now().isoformat()}\n")
-                    f.write(f"{'='*80}\n\n")
-                
-                # Group by original directory structure
-                from collections import defaultdict
-                by_directory = defaultdict(list)
-                
-                for mapping in file_mappings:
-                    original_path = mapping['from']
-                    new_path = mapping['to']
-                    original_dir = original_path.parent
-                    by_directory[original_dir].append((original_path, new_path))
-                
-                # Write grouped by directory structure (concise format)
-                for original_dir in sorted(by_directory.keys()):
-                    f.write(f"\n{original_dir}\n")
-                    
-                    for original_path, new_path in sorted(by_directory[original_dir]):
-                        # Show just the filename with new location
-                        filename = original_path.name
-                        f.write(f"  {filename} -> {new_path.name}\n")
-                
-                f.write("\n")
+                out.append(
+                    f"Original File Structure Mapping\n"
+                    f"Generated: {datetime.now().isoformat()}\n"
+                    f"{'='*80}\n\n"
+                )
+            
+            # Grouped by directory structure (concise format)
+            for original_dir, group in groupby(entries, key=lambda entry: entry[0]):
+                out.append(f"\n{original_dir}\n")
+                # Show just the filename with new location
+                out.extend(f"  {filename} -> {new_name}\n" for _, _, filename, new_name in group)
+            out.append("\n")
+            
+            with open(mapping_file, 'a', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(''.join(out))
             
             self.logger.info(f"Saved original structure mapping to: {mapping_file}")
             
         except Exception as e:
             self.logger.error(f"Error saving original structure mapping: {e}")
     
+    def _log_rmdir_error(self, directory: Path, error: OSError) -> None:
+        """
+        Log why a directory could not be removed (debug level).
+        
+        Args:
+            directory: Directory that rmdir() failed on
+            error: The OSError raised by rmdir()
+        """
+        msg = _RMDIR_ERRNO_MSG.get(error.errno)
+        if msg:
+            self.logger.debug("Directory %s %s", directory, msg)
+        else:
+            self.logger.debug("Could not remove directory %s: %s (errno: %s)", directory, error, error.errno)
+    
     def _cleanup_empty_directories(self, directories: List[Path], recursive: bool = True, 
                                     exclude_paths: Optional[List[Path]] = None) -> int:
         """
@@ -935,19 +1424,8 @@ class FileOrganizer:
         # Sort directories by depth (deepest first) to avoid deleting parent before child
         directories_sorted = sorted(directories, key=lambda p: len(p.parts), reverse=True)
         
-        # Helper function to check if directory should be excluded
-        def should_exclude(path: Path) -> bool:
-            """Check if path should be excluded from cleanup."""
-            if path in exclude_set:
-                return True
-            # Check if any exclude path is a parent of this path
-            for exclude_path in exclude_set:
-                try:
-                    path.relative_to(exclude_path)
-                    return True
-                except ValueError:
-                    continue
-            return False
+        # Check if a directory is (inside) an excluded path
+        should_exclude = _exclusion_checker(exclude_set)
         
         # Process each directory
         for directory in directories_sorted:
@@ -962,118 +1440,84 @@ class FileOrganizer:
                 
                 try:
                     if current_dir.is_dir():
-                        # More thorough check for empty directory
-                        # On Linux, hidden files (.files) might not be caught
+                        # Optimistically remove first: directories left behind by
+                        # moves are usually empty, and rmdir() refuses otherwise
+                        try:
+                            current_dir.rmdir()
+                        except OSError as e:
+                            if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                                self._log_rmdir_error(current_dir, e)
+                                break
+                        else:
+                            self.logger.info(f"Removed empty directory: {current_dir}")
+                            removed_dirs.add(current_dir)
+                            removed_count += 1
+                            
+                            # Continue with parent directory if recursive
+                            if recursive:
+                                current_dir = current_dir.parent
+                                continue
+                            else:
+                                break
+                        
+                        # Not empty: scan it once to see whether only subdirectories
+                        # remain, stopping at the first file (scandir entries carry
+                        # the file type, so there is no stat per entry)
+                        has_files = False
+                        subdirs = []
                         try:
-                            contents = list(current_dir.iterdir())
+                            with os.scandir(current_dir) as entries:
+                                for entry in entries:
+                                    try:
+                                        if entry.is_file(follow_symlinks=False):
+                                            has_files = True
+                                            break
+                                        if entry.is_dir(follow_symlinks=False):
+                                            subdirs.append(entry.path)
+                                    except (OSError, PermissionError):
+                                        # Skip items we can't access
+                                        continue
                         except (OSError, PermissionError) as e:
                             self.logger.debug(f"Error listing directory {current_dir}: {e}")
                             break
                         
-                        # Check if directory is empty
-                        # On Linux, iterdir() might not show all files, so we verify by trying rmdir
-                        if not contents:
-                            # Directory appears empty, try to remove it
-                            # rmdir() will fail if directory is not actually empty (e.g., has hidden files)
+                        if not has_files:
+                            # Try to remove empty subdirectories first (recursively)
+                            swept_count = 0
+                            for subdir in subdirs:
+                                if not should_exclude(subdir):
+                                    swept_count += self._cleanup_empty_directories_recursive(Path(subdir), removed_dirs, should_exclude)
+                            removed_count += swept_count
+                            
+                            if not swept_count:
+                                # Nothing below was removed, so the first rmdir() verdict stands
+                                self.logger.debug("Directory %s still has items after cleanup", current_dir)
+                                break
+                            
+                            # Retry now that empty subdirectories are gone
                             try:
                                 current_dir.rmdir()
-                                self.logger.info(f"Removed empty directory: {current_dir}")
-                                removed_dirs.add(current_dir)
-                                removed_count += 1
-                                
-                                # Continue with parent directory if recursive
-                                if recursive:
-                                    current_dir = current_dir.parent
-                                    continue
-                                else:
-                                    break
                             except OSError as e:
-                                # On Linux, errno 39 (ENOTEMPTY) means directory is not empty
-                                # errno 16 (EBUSY) means directory is in use
-                                # errno 13 (EACCES) means permission denied
-                                if hasattr(e, 'errno'):
-                                    if e.errno == 39:  # ENOTEMPTY
-                                        # Directory has hidden files or other entries
-                                        self.logger.debug(f"Directory {current_dir} is not empty (may have hidden files)")
-                                        # Try to list all files including hidden
-                                        try:
-                                            all_contents = os.listdir(str(current_dir))
-                                            if all_contents:
-                                                self.logger.debug(f"Directory {current_dir} contains: {all_contents}")
-                                            else:
-                                                # Empty but rmdir failed - might be a mount point or special case
-                                                self.logger.debug(f"Directory {current_dir} appears empty but cannot be removed")
-                                        except:
-                                            pass
-                                    elif e.errno == 16:  # EBUSY
-                                        self.logger.debug(f"Directory {current_dir} is busy (in use)")
-                                    elif e.errno == 13:  # EACCES
-                                        self.logger.debug(f"Permission denied removing directory {current_dir}")
+                                if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                                    # Directory still has contents, stop cleaning this path
+                                    self.logger.debug("Directory %s still has items after cleanup", current_dir)
                                 else:
-                                    self.logger.debug(f"Could not remove directory {current_dir}: {e}")
+                                    self.logger.debug(f"Could not remove directory {current_dir} after cleanup: {e} (errno: {e.errno})")
                                 break
-                        else:
-                            # Check if only empty subdirectories remain
-                            # On Linux, check for all types of entries including hidden files
-                            has_files = False
-                            has_dirs = False
                             
-                            for item in contents:
-                                try:
-                                    if item.is_file():
-                                        has_files = True
-                                        break
-                                    elif item.is_dir():
-                                        has_dirs = True
-                                except (OSError, PermissionError):
-                                    # Skip items we can't access
-                                    continue
+                            self.logger.info(f"Removed empty directory: {current_dir}")
+                            removed_dirs.add(current_dir)
+                            removed_count += 1
                             
-                            if not has_files:
-                                # Try to remove empty subdirectories first (recursively)
-                                for item in contents:
-                                    try:
-                                        if item.is_dir() and not should_exclude(item):
-                                            # Recursively clean up subdirectory
-                                            sub_removed = self._cleanup_empty_directories_recursive(item, removed_dirs, exclude_set)
-                                            removed_count += sub_removed
-                                    except (OSError, PermissionError) as e:
-                                        self.logger.debug(f"Error processing subdirectory {item}: {e}")
-                                
-                                # Check again if directory is now empty
-                                # Use os.listdir to catch hidden files on Linux
-                                try:
-                                    try:
-                                        # Use os.listdir first for complete listing (catches hidden files on Linux)
-                                        remaining_list = os.listdir(str(current_dir))
-                                        remaining = [current_dir / item for item in remaining_list]
-                                    except (OSError, PermissionError):
-                                        # Fall back to iterdir if os.listdir fails
-                                        remaining = list(current_dir.iterdir())
-                                    
-                                    if not remaining:
-                                        current_dir.rmdir()
-                                        self.logger.info(f"Removed empty directory: {current_dir}")
-                                        removed_dirs.add(current_dir)
-                                        removed_count += 1
-                                        
-                                        # Continue with parent directory if recursive
-                                        if recursive:
-                                            current_dir = current_dir.parent
-                                            continue
-                                        else:
-                                            break
-                                    else:
-                                        # Directory still has contents, stop cleaning this path
-                                        self.logger.debug(f"Directory {current_dir} still has {len(remaining)} items: {[r.name for r in remaining]}")
-                                        break
-                                except OSError as e:
-                                    errno = getattr(e, 'errno', None)
-                                    self.logger.debug(f"Could not remove directory {current_dir} after cleanup: {e} (errno: {errno})")
-                                    break
+                            # Continue with parent directory if recursive
+                            if recursive:
+                                current_dir = current_dir.parent
+                                continue
                             else:
-                                # Directory has files, stop cleaning
                                 break
+                        else:
+                            # Directory has files, stop cleaning
+                            break
                     else:
                         break
                 except (OSError, PermissionError) as e:
@@ -1083,70 +1527,113 @@ class FileOrganizer:
         return removed_count
     
     def _cleanup_empty_directories_recursive(self, directory: Path, removed_dirs: set, 
-                                             exclude_set: set) -> int:
+                                             should_exclude: Callable[[Path], bool]) -> int:
         """
         Helper method to recursively clean up empty subdirectories.
         
+        The tree is walked depth-first with an explicit stack instead of
+        Python recursion, so deep trees cost no interpreter frames and cannot
+        hit the recursion limit. Each directory is removed after its
+        subdirectories (post-order).
+        
+        Where the platform supports it, each directory is opened once and its
+        children are listed and removed relative to that descriptor
+        (scandir(fd) / rmdir(name, dir_fd=fd)), so the kernel does not
+        resolve the full path again for every removal.
+        
         Args:
             directory: Directory to clean up
             removed_dirs: Set of already removed directories (updated in place)
-            exclude_set: Set of paths to exclude
+            should_exclude: Exclusion test from _exclusion_checker()
         
         Returns:
             Number of directories removed
         """
-        removed_count = 0
-        
-        try:
-            if directory in removed_dirs:
-                return removed_count
+        # Debug lines below run once per directory: format them lazily
+        log = self.logger
+        stack = deque()
+        
+        def visit(path: Path, parent_fd: Optional[int]) -> int:
+            # Remove path outright if possible, otherwise push it for sweeping
+            if path in removed_dirs or should_exclude(path):
+                return 0
             
-            # Check if should exclude
-            for exclude_path in exclude_set:
-                try:
-                    directory.relative_to(exclude_path)
-                    return removed_count
-                except ValueError:
-                    continue
+            # Optimistically remove first: most directories reached here are
+            # already empty, and rmdir() refuses non-empty ones. On failure,
+            # sweep the subdirectories and retry once they are done.
+            try:
+                _rmdir_at(path, parent_fd)
+                log.debug("Removed empty subdirectory: %s", path)
+                removed_dirs.add(path)
+                return 1
+            except OSError:
+                pass
             
+            dir_fd = None
             try:
-                contents = list(directory.iterdir())
+                if _DIR_FD_SUPPORTED:
+                    if parent_fd is None:
+                        dir_fd = os.open(path, _DIR_OPEN_FLAGS)
+                    else:
+                        dir_fd = os.open(path.name, _DIR_OPEN_FLAGS, dir_fd=parent_fd)
+                with os.scandir(path if dir_fd is None else dir_fd) as entries:
+                    subdirs = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
             except (OSError, PermissionError) as e:
-                self.logger.debug(f"Error listing directory {directory}: {e}")
-                return removed_count
-            
-            # First, recursively clean up subdirectories
-            for item in contents:
-                try:
-                    if item.is_dir() and item not in removed_dirs:
-                        sub_removed = self._cleanup_empty_directories_recursive(item, removed_dirs, exclude_set)
-                        removed_count += sub_removed
-                except (OSError, PermissionError) as e:
-                    self.logger.debug(f"Error processing subdirectory {item}: {e}")
+                if dir_fd is not None:
+                    os.close(dir_fd)
+                log.debug("Error listing directory %s: %s", path, e)
+                return 0
             
-            # Check if directory is now empty
-            # Use os.listdir to catch hidden files on Linux
-            try:
-                try:
-                    # Use os.listdir for complete listing (catches hidden files)
-                    remaining_list = os.listdir(str(directory))
-                    remaining = [directory / item for item in remaining_list]
-                except (OSError, PermissionError):
-                    # Fall back to iterdir
-                    remaining = list(directory.iterdir())
+            stack.append(_SweepFrame(path, parent_fd, dir_fd, subdirs))
+            return 0
+        
+        removed_count = visit(directory, None)
+        
+        try:
+            while stack:
+                frame = stack[-1]
+                
+                # Sweep the next subdirectory of the directory on top
+                name = next(frame.subdirs, None)
+                if name is not None:
+                    item_path = frame.directory / name
+                    try:
+                        frame.removed += visit(item_path, frame.dir_fd)
+                    except (OSError, PermissionError) as e:
+                        log.debug("Error processing subdirectory %s: %s", item_path, e)
+                    continue
+                
+                # All subdirectories are done: retry the directory itself
+                stack.pop()
+                if frame.dir_fd is not None:
+                    os.close(frame.dir_fd)
                 
-                if not remaining:
-                    directory.rmdir()
-                    self.logger.debug(f"Removed empty subdirectory: {directory}")
-                    removed_dirs.add(directory)
-                    removed_count += 1
+                removed = frame.removed
+                if not removed:
+                    # Nothing below was removed, so the first rmdir() verdict stands
+                    log.debug("Directory %s still has items after cleanup", frame.directory)
                 else:
-                    self.logger.debug(f"Directory {directory} still has {len(remaining)} items after cleanup: {[r.name for r in remaining]}")
-            except OSError as e:
-                errno = getattr(e, 'errno', None)
-                self.logger.debug(f"Could not remove directory {directory}: {e} (errno: {errno}, may not be empty or in use)")
-        except (OSError, PermissionError) as e:
-            self.logger.debug(f"Error cleaning subdirectory {directory}: {e}")
+                    try:
+                        _rmdir_at(frame.directory, frame.parent_fd)
+                        log.debug("Removed empty subdirectory: %s", frame.directory)
+                        removed_dirs.add(frame.directory)
+                        removed += 1
+                    except OSError as e:
+                        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                            log.debug("Directory %s still has items after cleanup", frame.directory)
+                        else:
+                            log.debug("Could not remove directory %s: %s (errno: %s, may not be empty or in use)",
+                                      frame.directory, e, e.errno)
+                
+                if stack:
+                    stack[-1].removed += removed
+                else:
+                    removed_count = removed
+        finally:
+            # Only reached with frames left if something unexpected was raised
+            for frame in stack:
+                if frame.dir_fd is not None:
+                    os.close(frame.dir_fd)
         
         return removed_count
     
@@ -1166,46 +1653,37 @@ class FileOrganizer:
         removed_count = 0
         exclude_set = set(exclude_paths or [])
         
-        # Helper to check if path should be excluded
-        def should_exclude(path: Path) -> bool:
-            if path in exclude_set:
-                return True
-            for exclude_path in exclude_set:
-                try:
-                    path.relative_to(exclude_path)
-                    return True
-                except ValueError:
-                    continue
-            return False
+        # Check if a directory is (inside) an excluded path
+        should_exclude = _exclusion_checker(exclude_set)
+        
+        directory_str = str(directory)
+        if should_exclude(directory_str):
+            return removed_count
         
-        # Walk directory tree bottom-up (deepest first)
         try:
-            for root, dirs, files in os.walk(directory, topdown=False):
+            # Walk top-down so excluded subtrees are pruned instead of being
+            # walked and skipped entry by entry, recording directories as
+            # they are visited; the skip checks work on the path strings
+            visited = []
+            for root, dirs, files in os.walk(directory_str, topdown=True, followlinks=False):
+                dirs[:] = [name for name in dirs if not should_exclude(os.path.join(root, name))]
+                # Don't remove the root directory itself
+                if root != directory_str:
+                    visited.append(root)
+            
+            # Process bottom-up (deepest first): reversed pre-order visits
+            # every directory after all of its subdirectories
+            for root in reversed(visited):
                 root_path = Path(root)
                 
-                # Skip excluded paths
-                if should_exclude(root_path):
-                    continue
-                
-                # Skip if root path is the same as directory (don't remove root)
-                if root_path == directory:
-                    continue
-                
                 # Check if directory is empty
                 try:
-                    contents = list(root_path.iterdir())
-                    
-                    # More thorough check - verify directory is truly empty
-                    # On Linux, use os.listdir to catch hidden files that iterdir() might miss
-                    try:
-                        all_contents = os.listdir(str(root_path))
-                        is_empty = len(all_contents) == 0
-                    except (OSError, PermissionError):
-                        # If we can't list, check with iterdir
-                        is_empty = len(contents) == 0
-                        all_contents = contents
+                    with os.scandir(root_path) as entries:
+                        contents = list(entries)
                     
-                    if is_empty:
+                    # scandir lists hidden entries too, and rmdir() itself fails
+                    # with ENOTEMPTY if anything appeared since
+                    if not contents:
                         # Directory appears empty, try to remove it
                         try:
                             root_path.rmdir()
@@ -1213,21 +1691,13 @@ class FileOrganizer:
                             removed_count += 1
                         except OSError as e:
                             # On Linux, this could fail if directory is in use or has hidden files
-                            errno = getattr(e, 'errno', None)
-                            if errno == 39:  # ENOTEMPTY - directory not empty
-                                self.logger.debug(f"Directory {root_path} is not empty (ENOTEMPTY)")
-                            elif errno == 16:  # EBUSY - directory in use
-                                self.logger.debug(f"Directory {root_path} is busy (EBUSY)")
-                            elif errno == 13:  # EACCES - permission denied
-                                self.logger.debug(f"Permission denied removing {root_path} (EACCES)")
-                            else:
-                                self.logger.debug(f"Could not remove directory {root_path}: {e} (errno: {errno})")
+                            self._log_rmdir_error(root_path, e)
                     else:
                         # Check if only empty subdirectories remain (no files)
                         has_files = False
                         for item in contents:
                             try:
-                                if item.is_file():
+                                if item.is_file(follow_symlinks=False):
                                     has_files = True
                                     break
                             except (OSError, PermissionError):
@@ -1240,32 +1710,24 @@ class FileOrganizer:
                             removed_dirs = set()
                             for item in contents:
                                 try:
-                                    if item.is_dir() and not should_exclude(item):
-                                        sub_removed = self._cleanup_empty_directories_recursive(item, removed_dirs, exclude_set)
+                                    # The DirEntry type and path string are enough to
+                                    # filter; a Path is only built for the sweep
+                                    if item.is_dir(follow_symlinks=False) and not should_exclude(item.path):
+                                        sub_removed = self._cleanup_empty_directories_recursive(Path(item.path), removed_dirs, should_exclude)
                                         removed_count += sub_removed
                                 except (OSError, PermissionError) as e:
-                                    self.logger.debug(f"Error cleaning subdirectory {item}: {e}")
+                                    self.logger.debug(f"Error cleaning subdirectory {item.path}: {e}")
                             
                             # Check again if directory is now empty
-                            # Use os.listdir to catch hidden files on Linux
                             try:
-                                try:
-                                    # Use os.listdir for complete listing
-                                    remaining_list = os.listdir(str(root_path))
-                                    remaining = [root_path / item for item in remaining_list]
-                                except (OSError, PermissionError):
-                                    # Fall back to iterdir
-                                    remaining = list(root_path.iterdir())
-                                
-                                if not remaining:
+                                if _is_empty_dir(root_path):
                                     root_path.rmdir()
                                     self.logger.info(f"Removed empty directory: {root_path}")
                                     removed_count += 1
                                 else:
-                                    self.logger.debug(f"Directory {root_path} still has {len(remaining)} items: {[r.name for r in remaining]}")
+                                    self.logger.debug("Directory %s still has items after cleanup", root_path)
                             except OSError as e:
-                                errno = getattr(e, 'errno', None)
-                                self.logger.debug(f"Could not remove directory {root_path} after subdirectory cleanup: {e} (errno: {errno})")
+                                self.logger.debug(f"Could not remove directory {root_path} after subdirectory cleanup: {e} (errno: {e.errno})")
                 except (OSError, PermissionError) as e:
                     self.logger.debug(f"Error checking directory {root_path}: {e}")
         except Exception as e:
@@ -1293,149 +1755,81 @@ class FileOrganizer:
         if not output_dir.exists():
             return stats
         
-        # Files that should be moved to unorganized (not deleted)
-        unorganized_file_patterns = [
-            'thumbs.db',
-            '.ds_store',
-            'desktop.ini',
-            'folder.jpg',
-        ]
-        
-        # Directories that should be moved to unorganized
-        unorganized_dir_patterns = [
-            '__pycache__',
-            '.git',
-            '.svn',
-            '.cache',
-        ]
-        
-        # Category folders that should have their own unorganized_files
-        category_folders = ['movies', 'tv_shows', 'music', 'photos']
-        
         # Map of category folders to their unorganized_files directories
+        # (each category folder gets its own unorganized_files)
         category_unorganized_dirs = {}
-        for category in category_folders:
+        for category in _MEDIA_CATEGORIES:
             category_dir = output_dir / category
             if category_dir.exists():
                 unorganized_dir = category_dir / 'unorganized_files'
                 unorganized_dir.mkdir(parents=True, exist_ok=True)
                 category_unorganized_dirs[category_dir] = unorganized_dir
         
+        # Categories are disjoint subtrees and the cleanup is dominated by
+        # directory listing and rename syscalls, so run them in parallel
+        if category_unorganized_dirs:
+            with ThreadPoolExecutor(max_workers=len(category_unorganized_dirs)) as executor:
+                futures = [
+                    executor.submit(self._cleanup_category, category_dir, unorganized_dir)
+                    for category_dir, unorganized_dir in category_unorganized_dirs.items()
+                ]
+                for future in futures:
+                    for key, count in future.result().items():
+                        stats[key] += count
+        
+        return stats
+    
+    def _cleanup_category(self, category_dir: Path, unorganized_dir: Path) -> Dict[str, int]:
+        """
+        Clean up one category folder of the output directory.
+        Moves unwanted files/junk into the category's unorganized folder.
+        
+        Args:
+            category_dir: Category folder (e.g. output/movies)
+            unorganized_dir: The category's unorganized_files folder
+        
+        Returns:
+            Dictionary with cleanup statistics for this category
+        """
+        stats = {
+            'empty_dirs_removed': 0,
+            'files_moved_to_unorganized': 0,
+            'dirs_moved_to_unorganized': 0
+        }
+        
         try:
-            # Walk through output directory and collect files
-            for root, dirs, files in os.walk(output_dir, topdown=False):
-                root_path = Path(root)
-                
-                # Skip the unorganized_files directories themselves
-                if any(unorganized_dir == root_path or unorganized_dir in root_path.parents 
-                       for unorganized_dir in category_unorganized_dirs.values()):
-                    continue
-                
-                # Determine which category folder this path belongs to
-                target_unorganized_dir = None
-                for category_dir, unorganized_dir in category_unorganized_dirs.items():
-                    if root_path == category_dir or category_dir in root_path.parents:
-                        target_unorganized_dir = unorganized_dir
-                        break
-                
-                # If we're in a category folder, use its unorganized_files
-                # Otherwise, find the closest category parent
-                if not target_unorganized_dir:
-                    # Check if we're in a subdirectory of a category
-                    for category_dir, unorganized_dir in category_unorganized_dirs.items():
-                        try:
-                            root_path.relative_to(category_dir)
-                            target_unorganized_dir = unorganized_dir
-                            break
-                        except ValueError:
-                            continue
-                
-                # If still no category found, skip (we're outside categories or at root)
-                if not target_unorganized_dir:
-                    continue
-                
+            # Walk the category folder bottom-up. Paths stay strings until a
+            # filesystem operation needs a Path.
+            for root, relative_dir, dirs, files in _walk_category(category_dir, unorganized_dir):
                 # Move unwanted files to unorganized
                 for file_name in files:
-                    file_path = root_path / file_name
-                    file_lower = file_name.lower()
-                    
                     # Check if it should be moved to unorganized
-                    if any(pattern in file_lower for pattern in unorganized_file_patterns):
-                        try:
-                            # Determine the category folder this file is in
-                            file_category_dir = None
-                            for category_dir in category_unorganized_dirs.keys():
-                                try:
-                                    file_path.relative_to(category_dir)
-                                    file_category_dir = category_dir
-                                    break
-                                except ValueError:
-                                    continue
-                            
-                            if not file_category_dir:
-                                continue
-                            
-                            # Create subdirectory structure in category's unorganized_files
-                            relative_to_category = file_path.relative_to(file_category_dir)
-                            unorganized_dir = category_unorganized_dirs[file_category_dir]
-                            
-                            # If file is directly in category folder, put it directly in unorganized_files
-                            if relative_to_category.parent == Path('.'):
-                                dest_path = unorganized_dir / file_name
-                            else:
-                                # Preserve subdirectory structure within unorganized_files
-                                # Skip the file name itself, we only want the directory structure
-                                if len(relative_to_category.parts) > 1:
-                                    dest_path = unorganized_dir / relative_to_category.parent / file_name
-                                else:
-                                    dest_path = unorganized_dir / file_name
-                            
-                            # Ensure destination directory exists
-                            dest_path.parent.mkdir(parents=True, exist_ok=True)
-                            
-                            # Move file
-                            move_file_cross_device(file_path, dest_path)
-                            self.logger.info(f"Moved file to unorganized: {file_path} -> {dest_path}")
-                            stats['files_moved_to_unorganized'] += 1
-                        except Exception as e:
-                            self.logger.debug(f"Could not move file {file_path}: {e}")
-                
-                # Move unwanted directories to unorganized
-                dirs_to_process = list(dirs)  # Copy list since we're modifying it
-                for dir_name in dirs_to_process:
-                    dir_path = root_path / dir_name
-                    dir_lower = dir_name.lower()
-                    
-                    # Skip if it's an unorganized_files directory
-                    if any(unorganized_dir == dir_path or unorganized_dir in dir_path.parents
-                           for unorganized_dir in category_unorganized_dirs.values()):
+                    if file_name.lower() not in _UNORGANIZED_FILE_NAMES:
                         continue
                     
+                    file_path = Path(root, file_name)
+                    try:
+                        # Mirror the directory structure within unorganized_files
+                        # (relative_dir is '' directly in the category folder)
+                        dest_path = unorganized_dir / relative_dir / file_name
+                        
+                        # Ensure destination directory exists
+                        dest_path.parent.mkdir(parents=True, exist_ok=True)
+                        
+                        # Move file
+                        move_file_cross_device(file_path, dest_path)
+                        self.logger.info(f"Moved file to unorganized: {file_path} -> {dest_path}")
+                        stats['files_moved_to_unorganized'] += 1
+                    except Exception as e:
+                        self.logger.debug(f"Could not move file {file_path}: {e}")
+                
+                # Move unwanted directories to unorganized
+                for dir_name in dirs:
                     # Check if it should be moved to unorganized
-                    if any(pattern in dir_lower for pattern in unorganized_dir_patterns):
+                    if dir_name.lower() in _UNORGANIZED_DIR_NAMES:
+                        dir_path = Path(root, dir_name)
                         try:
-                            # Determine which category folder this directory is in
-                            dir_category_dir = None
-                            for category_dir in category_unorganized_dirs.keys():
-                                try:
-                                    dir_path.relative_to(category_dir)
-                                    dir_category_dir = category_dir
-                                    break
-                                except ValueError:
-                                    continue
-                            
-                            if not dir_category_dir:
-                                continue
-                            
-                            # Create destination path in category's unorganized_files
-                            relative_to_category = dir_path.relative_to(dir_category_dir)
-                            unorganized_dir = category_unorganized_dirs[dir_category_dir]
-                            
-                            # Preserve directory structure within unorganized_files
-                            if relative_to_category.parent == Path('.'):
-                                dest_path = unorganized_dir / dir_name
-                            else:
-                                dest_path = unorganized_dir / relative_to_category.parent / dir_name
+                            dest_path = unorganized_dir / relative_dir / dir_name
                             
                             # Ensure parent directory exists
                             dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1443,56 +1837,12 @@ class FileOrganizer:
                             # Move directory
                             if dest_path.exists():
                                 # If destination exists, merge contents
-                                for item in dir_path.iterdir():
-                                    item_dest = dest_path / item.name
-                                    if item.is_file():
-                                        if item_dest.exists():
-                                            # Append number if file exists
-                                            counter = 1
-                                            stem = item_dest.stem
-                                            suffix = item_dest.suffix
-                                            while item_dest.exists():
-                                                item_dest = dest_path / f"{stem}_{counter}{suffix}"
-                                                counter += 1
-                                        move_file_cross_device(item, item_dest)
-                                    elif item.is_dir():
-                                        if item_dest.exists():
-                                            # Merge directories recursively
-                                            for subitem in item.iterdir():
-                                                subitem_dest = item_dest / subitem.name
-                                                if subitem.is_file():
-                                                    if subitem_dest.exists():
-                                                        counter = 1
-                                                        stem = subitem_dest.stem
-                                                        suffix = subitem_dest.suffix
-                                                        while subitem_dest.exists():
-                                                            subitem_dest = item_dest / f"{stem}_{counter}{suffix}"
-                                                            counter += 1
-                                                    move_file_cross_device(subitem, subitem_dest)
-                                                else:
-                                                    # Recursively copy directory
-                                                    if not subitem_dest.exists():
-                                                        shutil.copytree(subitem, subitem_dest)
-                                                    # Remove source subdirectory after copying
-                                                    if item.exists():
-                                                        try:
-                                                            shutil.rmtree(subitem)
-                                                        except OSError:
-                                                            pass
-                                        else:
-                                            # Simple move for subdirectory
-                                            item.rename(item_dest)
-                                # Remove source directory if empty
-                                try:
-                                    if not list(dir_path.iterdir()):
-                                        dir_path.rmdir()
-                                except OSError:
-                                    pass
+                                _merge_into(str(dir_path), str(dest_path))
                             else:
                                 # Simple move - use cross-device move for safety
                                 try:
                                     # Try rename first (fast)
-                                    dir_path.rename(dest_path)
+                                    os.rename(dir_path, dest_path)
                                 except OSError:
                                     # If rename fails (cross-device), use copy+delete
                                     shutil.copytree(dir_path, dest_path)
@@ -1503,27 +1853,48 @@ class FileOrganizer:
                         except Exception as e:
                             self.logger.debug(f"Could not move directory {dir_path}: {e}")
                 
-                # Try to remove empty directory (but not unorganized_files directories or category folders)
-                is_unorganized_dir = any(unorganized_dir == root_path or unorganized_dir in root_path.parents
-                                       for unorganized_dir in category_unorganized_dirs.values())
-                is_category_dir = root_path in category_unorganized_dirs.keys()
-                
-                if root_path != output_dir and not is_unorganized_dir and not is_category_dir:
+                # Try to remove empty directory (but not category folders; the walk
+                # never enters unorganized_files directories)
+                if relative_dir:
                     try:
-                        contents = list(root_path.iterdir())
-                        if not contents:
-                            root_path.rmdir()
-                            self.logger.info(f"Removed empty output directory: {root_path}")
-                            stats['empty_dirs_removed'] += 1
+                        # rmdir() itself refuses non-empty directories
+                        os.rmdir(root)
+                        self.logger.info(f"Removed empty output directory: {root}")
+                        stats['empty_dirs_removed'] += 1
                     except OSError:
                         # Directory not empty or error, skip
                         pass
                     
         except Exception as e:
-            self.logger.error(f"Error cleaning up output directory: {e}")
+            self.logger.error(f"Error cleaning up output directory {category_dir}: {e}")
         
         return stats
     
+    def _try_fast_rename(self, source: Path, destination: Path) -> bool:
+        """
+        Try to move a file with a single rename into an existing directory.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+        
+        Returns:
+            True if the file was moved, False if the caller should fall back
+            to move_file_cross_device (cross-device move, missing parent, etc.)
+        """
+        dir_pair = (source.parent, destination.parent)
+        if dir_pair in self._cross_device_dirs:
+            return False
+        
+        try:
+            os.rename(source, destination)
+            return True
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                # Remember so later moves between these directories skip the attempt
+                self._cross_device_dirs.add(dir_pair)
+            return False
+    
     def execute_move(self, move_plan: Dict, dry_run: bool = False) -> bool:
         """
         Execute a planned file move.
@@ -1536,52 +1907,56 @@ class FileOrganizer:
             True if successful
         """
         try:
+            # Plans from plan_file_move() carry their paths as strings
+            from_str = move_plan.get('from_str') or str(move_plan['from'])
+            to_str = move_plan.get('to_str') or str(move_plan['to'])
+            
             if dry_run:
-                self.logger.info(f"[DRY RUN] Would move: {move_plan['from']} -> {move_plan['to']}")
+                self.logger.info(f"[DRY RUN] Would move: {from_str} -> {to_str}")
                 return True
             
+            # Cached listings of the source and target directories go stale
+            self._dir_cache.pop(move_plan['from'].parent, None)
+            self._dir_cache.pop(move_plan['to'].parent, None)
+            
             # Track file mappings for unorganized files
             file_mappings = []
             
             # Move main file
             if move_plan['changed']:
-                if move_file_cross_device(move_plan['file'], move_plan['to']):
-                    self.logger.info(f"Moved: {move_plan['from']} -> {move_plan['to']}")
+                if (self._try_fast_rename(move_plan['file'], move_plan['to']) or
+                        move_file_cross_device(move_plan['file'], move_plan['to'])):
+                    self.logger.info(f"Moved: {from_str} -> {to_str}")
                     
                     # Track mapping for unorganized files (not recognized patterns)
                     if not move_plan.get('is_recognized', True):
-                        file_mappings.append({
-                            'from': move_plan['from'],
-                            'to': move_plan['to']
-                        })
+                        file_mappings.append(FileMapping(from_str, to_str))
                 else:
-                    raise Exception(f"Failed to move file: {move_plan['from']}")
+                    raise Exception(f"Failed to move file: {from_str}")
             
             # Move associated files
             for assoc in move_plan['associated']:
-                if move_file_cross_device(assoc['from'], assoc['to']):
-                    self.logger.info(f"Moved associated: {assoc['from']} -> {assoc['to']}")
+                assoc_from = assoc.get('from_str') or str(assoc['from'])
+                assoc_to = assoc.get('to_str') or str(assoc['to'])
+                if (self._try_fast_rename(assoc['from'], assoc['to']) or
+                        move_file_cross_device(assoc['from'], assoc['to'])):
+                    self.logger.info(f"Moved associated: {assoc_from} -> {assoc_to}")
                     
                     # Track mapping for associated files of unorganized main files
                     if not move_plan.get('is_recognized', True):
-                        file_mappings.append({
-                            'from': assoc['from'],
-                            'to': assoc['to']
-                        })
+                        file_mappings.append(FileMapping(assoc_from, assoc_to))
                 else:
-                    raise Exception(f"Failed to move associated file: {assoc['from']}")
+                    raise Exception(f"Failed to move associated file: {assoc_from}")
             
             # Save original structure mapping for unorganized files
             if file_mappings and not move_plan.get('is_recognized', True):
                 self._save_original_structure(move_plan['target_dir'], file_mappings)
             
             # Track source directory for cleanup (if we moved from a different location)
-            if move_plan['changed'] and move_plan['from'].parent != move_plan['to'].parent:
-                source_dir = move_plan['from'].parent
-                if source_dir.exists():
+            if move_plan['changed']:
+                source_dir = os.path.dirname(from_str)
+                if source_dir != os.path.dirname(to_str) and os.path.exists(source_dir):
                     # Store source directory for later cleanup
-                    if not hasattr(self, '_source_directories'):
-                        self._source_directories = set()
                     self._source_directories.add(source_dir)
             
             return True
@@ -1,9 +1,39 @@
 """Configuration management for Media Library Manager."""
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed YAML files, keyed by path and modification time
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+    
+    Callers get their own copy, since Config.set() modifies it in place.
+    
+    Args:
+        path: Path to YAML file
+    
+    Returns:
+        Parsed mapping (empty if the file is empty)
+    """
+    key = (str(path), path.stat().st_mtime_ns)
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_Loader) or {}
+        _YAML_CACHE[key] = data
+    return copy.deepcopy(data)
 
 
 class Config:
@@ -33,16 +63,15 @@ class Config:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.rules = self._load_rules()
+        self._flat = self._flatten(self.config)
+        self._extensions_set = None
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f) or {}
-        
-        return config
+        return _load_yaml(self.config_path)
     
     def _load_rules(self) -> Dict[str, Any]:
         """Load rules from rules.yaml."""
@@ -51,10 +80,31 @@ class Config:
         if not rules_path.exists():
             return {}
         
-        with open(rules_path, 'r', encoding='utf-8') as f:
-            rules = yaml.safe_load(f) or {}
+        return _load_yaml(rules_path)
+    
+    def _flatten(self, config: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """
+        Index a nested configuration by dot-notation key.
         
-        return rules
+        Sections are indexed as well as leaves, so 'advanced' maps to the
+        whole section and 'advanced.max_workers' to the value within it.
+        
+        Args:
+            config: Nested configuration dictionary
+            prefix: Dot-notation key of config itself ('' for the root)
+        
+        Returns:
+            Dictionary mapping dot-notation keys to values
+        """
+        flat = {}
+        for key, value in config.items():
+            if not isinstance(key, str):
+                continue
+            flat_key = prefix + key
+            flat[flat_key] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, flat_key + '.'))
+        return flat
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -67,15 +117,7 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self.config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -97,6 +139,10 @@ class Config:
         
         # Set the final value
         config[keys[-1]] = value
+        
+        # Derived lookups may depend on the changed value
+        self._flat = self._flatten(self.config)
+        self._extensions_set = None
     
     def get_media_paths(self) -> Dict[str, list]:
         """Get all media library paths."""
@@ -115,9 +161,15 @@ class Config:
         extensions.extend(self.get('advanced.photo_extensions', []))
         return extensions
     
+    def get_supported_extensions(self) -> frozenset:
+        """Get all supported file extensions, lowercased, as a set (built once)."""
+        if self._extensions_set is None:
+            self._extensions_set = frozenset(e.lower() for e in self.get_all_extensions())
+        return self._extensions_set
+    
     def is_extension_supported(self, extension: str) -> bool:
         """Check if file extension is supported."""
-        return extension.lower() in [e.lower() for e in self.get_all_extensions()]
+        return extension.lower() in self.get_supported_extensions()
     
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access."""
@@ -2,45 +2,215 @@
 
 import os
 import hashlib
+import mmap
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+try:
+    import xxhash  # Optional: fast non-cryptographic hashing of file heads
+except ImportError:
+    xxhash = None
 
-def get_file_size(file_path: Path) -> int:
-    """Get file size in bytes."""
+try:
+    import blake3  # Optional: the "blake3" hash algorithm
+except ImportError:
+    blake3 = None
+
+# get_directory_size() switches to a thread pool once this many directories are pending
+_PARALLEL_SCAN_MIN_DIRS = 4
+
+# get_file_hash() falls back to hashing files at least this large through a memory map
+_MMAP_HASH_MIN_SIZE = 64 << 20
+
+# get_file_hash(mode="partial") hashes only this many bytes from the start of the file
+PARTIAL_HASH_SIZE = 1 << 20
+
+# hash_many() hands this many files per worker to the pool at a time
+_HASH_BATCH_PER_WORKER = 4
+
+# Characters that are invalid in filenames on Windows or Unix (plus ASCII
+# control characters), mapped to their replacement for clean_filename()
+_INVALID_FILENAME_CHARS = str.maketrans(
+    {**{chr(code): '_' for code in range(32)}, **{char: '_' for char in '<>:"/\\|?*'}}
+)
+
+# Whether directories can be listed through an open descriptor, so that
+# DirEntry.stat() becomes fstatat(dir_fd, name) instead of a full-path lstat
+_SCAN_DIR_FD = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+
+def get_file_size(file_path: Union[str, os.PathLike],
+                  stat_result: Optional[os.stat_result] = None) -> int:
+    """Get file size in bytes (from stat_result, if the caller already has one)."""
+    if stat_result is not None:
+        return stat_result.st_size
     try:
-        return file_path.stat().st_size
+        return os.stat(file_path).st_size
     except (OSError, IOError):
         return 0
 
 
-def get_file_hash(file_path: Path, algorithm: str = "md5", chunk_size: int = 8192) -> Optional[str]:
+def _new_hash(algorithm: str):
+    """
+    Create a hash object for an algorithm name.
+    
+    Args:
+        algorithm: A hashlib algorithm (md5, sha256, ...), "blake3" (requires
+            the blake3 package) or "xxh3" (requires the xxhash package)
+    
+    Returns:
+        Object with update() and hexdigest()
+    
+    Raises:
+        ValueError: If the algorithm is not available
+    """
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ValueError("the blake3 hash algorithm requires the blake3 package")
+        return blake3.blake3()
+    if algorithm == 'xxh3':
+        if xxhash is None:
+            raise ValueError("the xxh3 hash algorithm requires the xxhash package")
+        return xxhash.xxh3_64()
+    return hashlib.new(algorithm)
+
+
+def get_file_hash(file_path: Path, algorithm: str = "md5", chunk_size: int = 1 << 20,
+                  mode: str = "full") -> Optional[str]:
     """
     Calculate file hash.
     
+    The file is hashed in C without a Python-level read loop where possible:
+    hashlib.file_digest() on Python 3.11+, otherwise large files are
+    memory-mapped and hashed in a single update.
+    
+    A partial hash covers only the first MiB of the file. It is meant to rule
+    out files that can't be duplicates, and uses xxh3 when the xxhash package
+    is installed (algorithm otherwise), so partial hashes are only
+    comparable with each other.
+    
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (md5, sha256)
-        chunk_size: Size of chunks to read
+        algorithm: Hash algorithm (md5, sha256, blake3)
+        chunk_size: Size of chunks to read (when neither of the above applies)
+        mode: "full" to hash the whole file, "partial" to hash its start
     
     Returns:
         Hex digest of file hash or None if error
     """
-    hash_alg = hashlib.new(algorithm)
-    
     try:
         with open(file_path, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                hash_alg.update(chunk)
-        return hash_alg.hexdigest()
+            if mode == 'partial':
+                hash_alg = _new_hash('xxh3' if xxhash is not None else algorithm)
+                hash_alg.update(f.read(PARTIAL_HASH_SIZE))
+                return hash_alg.hexdigest()
+            
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, partial(_new_hash, algorithm)).hexdigest()
+            
+            hash_alg = _new_hash(algorithm)
+            if os.fstat(f.fileno()).st_size >= _MMAP_HASH_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    hash_alg.update(buf)
+            else:
+                for chunk in iter(lambda: f.read(chunk_size), b''):
+                    hash_alg.update(chunk)
+            return hash_alg.hexdigest()
     except (OSError, IOError) as e:
         print(f"Error hashing file {file_path}: {e}")
         return None
 
 
+def _hash_one(path_str: str, algorithm: str, chunk_size: int) -> Optional[str]:
+    """Hash a single file in a worker process (module level so it can be pickled)."""
+    try:
+        return get_file_hash(Path(path_str), algorithm, chunk_size)
+    except Exception as e:
+        # Report the file and carry on, like the thread pool in FileHasher.hash_files
+        print(f"Error hashing file {path_str}: {e}")
+        return None
+
+
+def _inode_order(path: Path) -> int:
+    """Sort key placing files in on-disk (inode) order; unreadable files go first."""
+    try:
+        return path.stat().st_ino
+    except OSError:
+        return 0
+
+
+def _advise_willneed(paths: List[Path]) -> None:
+    """Ask the kernel to start reading files into the page cache ahead of hashing."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def hash_many(paths: List[Path], algorithm: str = "md5", chunk_size: int = 1 << 20,
+              max_workers: Optional[int] = None,
+              on_hashed: Optional[Callable[[Path, Optional[str]], None]] = None) -> Dict[Path, str]:
+    """
+    Calculate hashes for many files in a process pool.
+    
+    Files are hashed in inode order to limit seeking on spinning disks, in
+    batches of a few files per worker. While one batch is being hashed,
+    readahead is requested for the next one, so disk reads overlap with
+    hashing.
+    
+    Args:
+        paths: Files to hash
+        algorithm: Hash algorithm (md5, sha256)
+        chunk_size: Size of chunks to read (see get_file_hash)
+        max_workers: Process pool size (None for one per CPU)
+        on_hashed: Optional callback called with each path and its hash
+            (None if hashing failed) as results come in
+    
+    Returns:
+        Dictionary mapping file path to hash, for files that could be hashed
+    """
+    ordered = sorted(paths, key=_inode_order)
+    workers = max_workers or os.cpu_count() or 1
+    batch_size = workers * _HASH_BATCH_PER_WORKER
+    batches = [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
+    hash_one = partial(_hash_one, algorithm=algorithm, chunk_size=chunk_size)
+    
+    hash_map = {}
+    if not batches:
+        return hash_map
+    
+    _advise_willneed(batches[0])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for index, batch in enumerate(batches):
+            results = executor.map(hash_one, [os.fspath(path) for path in batch], chunksize=8)
+            if index + 1 < len(batches):
+                _advise_willneed(batches[index + 1])
+            
+            for path, file_hash in zip(batch, results):
+                if file_hash:
+                    hash_map[path] = file_hash
+                if on_hashed is not None:
+                    on_hashed(path, file_hash)
+    
+    return hash_map
+
+
 def clean_filename(filename: str) -> str:
     """
-    Clean filename by removing invalid characters.
+    Clean filename by replacing invalid and control characters.
     
     Args:
         filename: Original filename
@@ -48,15 +218,9 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    # Remove invalid characters for Windows and Unix
-    invalid_chars = '<>:"/\\|?*'
-    cleaned = filename
-    
-    for char in invalid_chars:
-        cleaned = cleaned.replace(char, '_')
-    
-    # Remove leading/trailing spaces and dots
-    cleaned = cleaned.strip(' .')
+    # Replace invalid characters for Windows and Unix in a single pass,
+    # then remove leading/trailing spaces and dots
+    cleaned = filename.translate(_INVALID_FILENAME_CHARS).strip(' .')
     
     return cleaned
 
@@ -71,21 +235,83 @@ def get_file_extension(file_path: Path) -> str:
     return file_path.suffix.lower()
 
 
-def is_media_file(file_path: Path, extensions: List[str]) -> bool:
-    """Check if file is a supported media file."""
-    return get_file_extension(file_path) in [ext.lower() for ext in extensions]
+def is_media_file(file_path: Path, extensions: Iterable[str]) -> bool:
+    """
+    Check if file is a supported media file.
+    
+    A set or frozenset of extensions is used as is and must already be
+    lowercased (see Config.get_supported_extensions); other iterables are
+    lowercased on every call.
+    """
+    if not isinstance(extensions, (set, frozenset)):
+        extensions = [ext.lower() for ext in extensions]
+    return get_file_extension(file_path) in extensions
 
 
-def get_directory_size(directory: Path) -> int:
-    """Calculate total size of all files in directory."""
-    total_size = 0
-    
+def _scan_directory(path: str) -> Tuple[int, List[str]]:
+    """Sum the sizes of the files directly in a directory and list its subdirectories."""
+    size = 0
+    subdirs = []
+    dir_fd = None
     try:
-        for file_path in directory.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        # Entry types come with the listing. Listing through a descriptor makes
+        # each size lookup a stat relative to it, so the kernel doesn't walk
+        # the whole path again for every file. On Windows, scandir() is built
+        # on FindFirstFile/FindNextFile, which return sizes and times in bulk
+        # with the listing, so entry.stat() costs no system call at all.
+        if _SCAN_DIR_FD:
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        with os.scandir(path if dir_fd is None else dir_fd) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(os.path.join(path, entry.name))
+                    elif entry.is_file(follow_symlinks=False):
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
     except (OSError, PermissionError):
         pass
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    return size, subdirs
+
+
+def get_directory_size(directory: Path, max_workers: Optional[int] = None) -> int:
+    """
+    Calculate total size of all files in directory (symlinks are not followed).
+    
+    Narrow trees are walked serially. Once enough subdirectories are pending,
+    they are scanned in a thread pool, since directory listing and stat calls
+    release the GIL.
+    
+    Args:
+        directory: Directory to measure
+        max_workers: Thread pool size (None for the executor's default)
+    
+    Returns:
+        Total size in bytes
+    """
+    total_size = 0
+    pending = [os.fspath(directory)]
+    
+    # Scan serially while the tree is narrow; threads don't pay off there
+    while pending and len(pending) < _PARALLEL_SCAN_MIN_DIRS:
+        size, subdirs = _scan_directory(pending.pop())
+        total_size += size
+        pending.extend(subdirs)
+    
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_scan_directory, path) for path in pending}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    size, subdirs = future.result()
+                    total_size += size
+                    futures.update(executor.submit(_scan_directory, path) for path in subdirs)
     
     return total_size
 
@@ -99,14 +325,69 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.2f} PB"
 
 
-def get_file_mtime(file_path: Path) -> float:
+def get_file_mtime(file_path: Union[str, os.PathLike]) -> float:
     """Get file modification time."""
     try:
-        return file_path.stat().st_mtime
+        return os.stat(file_path).st_mtime
     except (OSError, IOError):
         return 0
 
 
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> int:
+    """
+    Copy a file between descriptors without passing the data through Python.
+    
+    Uses copy_file_range() (which can reflink on btrfs/xfs), then sendfile()
+    for whatever it could not copy. Either may be missing or unsupported for
+    a given pair of filesystems.
+    
+    Args:
+        src_fd: Source descriptor, positioned at the start of the file
+        dst_fd: Destination descriptor, positioned at the start of the file
+        size: Number of bytes to copy
+    
+    Returns:
+        Number of bytes copied; both descriptors are positioned after them
+    """
+    offset = 0
+    
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst_fd, size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    
+    if offset < size and hasattr(os, 'sendfile'):
+        try:
+            while offset < size:
+                copied = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    
+    return offset
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    """Copy a file with its metadata, like shutil.copy2(), copying in the kernel where possible."""
+    with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = _kernel_copy(fsrc.fileno(), fdst.fileno(), size)
+        if copied < size:
+            # Copy the rest in userspace
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    
+    shutil.copystat(source, destination)
+
+
 def move_file_cross_device(source: Path, destination: Path) -> bool:
     """
     Move a file, handling cross-device moves safely.
@@ -122,19 +403,23 @@ def move_file_cross_device(source: Path, destination: Path) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Ensure destination directory exists
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure destination directory exists (one stat when it already does,
+        # rather than a failing mkdir followed by a stat)
+        destination_str = os.fspath(destination)
+        parent = os.path.dirname(destination_str)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
         
-        # Try rename first (fast for same filesystem)
+        # Try rename first (fast for same filesystem); plain os.rename on the
+        # path strings skips building a new Path for the result
         try:
-            source.rename(destination)
+            os.rename(os.fspath(source), destination_str)
             return True
         except OSError as e:
             # If rename fails with cross-device error, use copy+delete
             if e.errno == 18:  # Invalid cross-device link (Errno 18)
-                # Copy file
-                import shutil
-                shutil.copy2(source, destination)
+                # Copy file contents and metadata
+                _copy_file(source, destination)
                 
                 # Delete original after successful copy
                 source.unlink()
@@ -1,9 +1,31 @@
 """Logging setup for Media Library Manager."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Background listeners writing queued records to log files, by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Write out the records queued for a logger's file and stop its listener."""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Stop all listeners at exit so that no queued record is lost."""
+    for name in list(_listeners):
+        _stop_listener(name)
 
 
 def setup_logger(
@@ -15,6 +37,10 @@ def setup_logger(
     """
     Set up logging for the application.
     
+    Records for the log file are queued and written by a background thread
+    as they arrive, so logging in hot loops doesn't wait on file I/O. Console
+    output stays synchronous to keep its order with other terminal output.
+    
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -29,6 +55,7 @@ def setup_logger(
     
     # Clear any existing handlers
     logger.handlers = []
+    _stop_listener(name)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -51,6 +78,11 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
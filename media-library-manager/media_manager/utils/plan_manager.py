@@ -2,10 +2,36 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster plan file (de)serialization
+except ImportError:
+    orjson = None
+
+
+def _write_json(data: Dict[str, Any], output_file: Path) -> None:
+    """Write data to a file as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_json(plan_file: Path) -> Any:
+    """Read JSON data from a file (raises json.JSONDecodeError on invalid JSON)."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(plan_file, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(plan_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class PlanManager:
     """Manage saving and loading of action plans."""
@@ -69,8 +95,7 @@ class PlanManager:
                     pass
             
             # Write JSON file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(plan_data, f, indent=2, ensure_ascii=False)
+            _write_json(plan_data, output_file)
             
             self.logger.info(f"Saved duplicate plan to: {output_file}")
             return True
@@ -94,8 +119,7 @@ class PlanManager:
                 self.logger.error(f"Plan file not found: {plan_file}")
                 return None
             
-            with open(plan_file, 'r', encoding='utf-8') as f:
-                plan_data = json.load(f)
+            plan_data = _read_json(plan_file)
             
             # Validate plan structure
             if plan_data.get('type') != 'duplicate_removal':
@@ -153,15 +177,16 @@ class PlanManager:
             }
             
             for plan in plans:
+                # Prefer the path strings cached on plans by plan_file_move()
                 plan_entry = {
-                    'from': str(plan['from']),
-                    'to': str(plan['to']),
+                    'from': plan.get('from_str') or str(plan['from']),
+                    'to': plan.get('to_str') or str(plan['to']),
                     'media_type': plan.get('media_type', 'unknown'),
                     'changed': plan.get('changed', False),
                     'associated': [
                         {
-                            'from': str(a['from']),
-                            'to': str(a['to'])
+                            'from': a.get('from_str') or str(a['from']),
+                            'to': a.get('to_str') or str(a['to'])
                         }
                         for a in plan.get('associated', [])
                     ]
@@ -179,8 +204,7 @@ class PlanManager:
                     pass
             
             # Write JSON file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(plan_data, f, indent=2, ensure_ascii=False)
+            _write_json(plan_data, output_file)
             
             self.logger.info(f"Saved organization plan to: {output_file}")
             return True
@@ -204,26 +228,36 @@ class PlanManager:
                 self.logger.error(f"Plan file not found: {plan_file}")
                 return None
             
-            with open(plan_file, 'r', encoding='utf-8') as f:
-                plan_data = json.load(f)
+            plan_data = _read_json(plan_file)
             
             # Validate plan structure
             if plan_data.get('type') != 'file_organization':
                 self.logger.error(f"Invalid plan type: {plan_data.get('type')}")
                 return None
             
-            # Convert string paths back to Path objects
+            # Convert string paths back to Path objects. Plans list many files
+            # per directory, so each directory's Path is built once and file
+            # paths are derived from it, sharing its component strings.
+            dir_paths = {}
+            
+            def to_path(path_str: str) -> Path:
+                directory, name = os.path.split(path_str)
+                parent = dir_paths.get(directory)
+                if parent is None:
+                    parent = dir_paths[directory] = Path(directory)
+                return parent / name
+            
             plans = []
             for plan_entry in plan_data.get('plans', []):
                 plan = {
-                    'from': Path(plan_entry['from']),
-                    'to': Path(plan_entry['to']),
+                    'from': to_path(plan_entry['from']),
+                    'to': to_path(plan_entry['to']),
                     'media_type': plan_entry.get('media_type', 'unknown'),
                     'changed': plan_entry.get('changed', False),
                     'associated': [
                         {
-                            'from': Path(a['from']),
-                            'to': Path(a['to'])
+                            'from': to_path(a['from']),
+                            'to': to_path(a['to'])
                         }
                         for a in plan_entry.get('associated', [])
                     ]
@@ -2,6 +2,7 @@
 """Basic test to verify the Media Library Manager setup."""
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Import modules at the top level
@@ -9,7 +10,7 @@ from media_manager import Config, setup_logger
 from media_manager.core.scanner import MediaScanner
 from media_manager.core.hasher import FileHasher
 from media_manager.core.duplicate_finder import DuplicateFinder
-from media_manager.utils.file_utils import get_file_hash, get_file_size, format_file_size
+from media_manager.utils.file_utils import PARTIAL_HASH_SIZE, get_file_hash, get_file_size, format_file_size
 
 def test_imports():
     """Test that all main modules can be imported."""
@@ -51,8 +52,7 @@ def test_basic_operations():
     
     try:
         # Test with this file
-        test_file = Path(__file__)
-        size = get_file_size(test_file)
+        size = get_file_size(__file__)
         formatted = format_file_size(size)
         
         print(f"[OK] File size: {formatted}")
@@ -61,6 +61,66 @@ def test_basic_operations():
         print(f"[FAIL] Operation error: {e}")
         return False
 
+def test_hashing():
+    """Test full and partial file hashing."""
+    print("\nTesting hashing...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Equal files, and a file that only differs after the partial hash size
+            data = b"media" * (PARTIAL_HASH_SIZE // 4)
+            first = Path(temp_dir) / "first.bin"
+            second = Path(temp_dir) / "second.bin"
+            third = Path(temp_dir) / "third.bin"
+            first.write_bytes(data)
+            second.write_bytes(data)
+            third.write_bytes(data[:-1] + b"!")
+            
+            for mode in ("partial", "full"):
+                if get_file_hash(first, mode=mode) != get_file_hash(second, mode=mode):
+                    print(f"[FAIL] Equal files have different {mode} hashes")
+                    return False
+            
+            if get_file_hash(first, mode="partial") != get_file_hash(third, mode="partial"):
+                print("[FAIL] Files with the same start have different partial hashes")
+                return False
+            if get_file_hash(first) == get_file_hash(third):
+                print("[FAIL] Different files have the same full hash")
+                return False
+        
+        print("[OK] Full and partial hashes")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Hashing error: {e}")
+        return False
+
+def test_bad_hash_algorithm():
+    """Test that duplicate detection survives an unsupported hash algorithm."""
+    print("\nTesting unsupported hash algorithm...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Equal files over the partial hash size go through both hash passes
+            data = b"media" * (PARTIAL_HASH_SIZE // 4)
+            files = [Path(temp_dir) / "first.bin", Path(temp_dir) / "second.bin"]
+            for file_path in files:
+                file_path.write_bytes(data)
+            
+            config = Config()
+            config.set('advanced.hash_algorithm', 'sha999')
+            for executor in ("threads", "processes"):
+                config.set('advanced.hash_executor', executor)
+                duplicates = FileHasher(config).find_hash_duplicates(files)
+                if duplicates:
+                    print(f"[FAIL] Files matched without a usable hash ({executor})")
+                    return False
+        
+        print("[OK] Unhashable files are skipped")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Unsupported algorithm error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -70,19 +130,19 @@ def main():
     tests = [
         test_imports,
         test_config,
-        test_basic_operations
+        test_basic_operations,
+        test_hashing,
+        test_bad_hash_algorithm
     ]
     
-    results = []
-    for test in tests:
-        results.append(test())
+    failed = [test.__name__ for test in tests if not test()]
     
     print("\n" + "=" * 60)
-    if all(results):
+    if not failed:
         print("[OK] All tests passed!")
         return 0
     else:
-        print("[FAIL] Some tests failed")
+        print(f"[FAIL] Some tests failed: {', '.join(failed)}")
         return 1
 
 if __name__ == '__main__':
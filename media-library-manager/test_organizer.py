@@ -1,74 +1,125 @@
 #!/usr/bin/env python3
 """Test script to demonstrate file organizer functionality."""
 
+import logging
 import sys
-from pathlib import Path
-from media_manager import Config, setup_logger
+from functools import lru_cache
+from media_manager import Config
 from media_manager.organizer.file_organizer import FileOrganizer
 
+# Logger for the organizer under test (no handlers, like setup_logger(console=False))
+logger = logging.getLogger("test_organizer")
+
+
+# Filename transformation cases: (input_filename, expected_output)
+TRANSFORMATION_CASES = [
+    # Movies
+    ("[SomeGroup] Movie.Name.2020.BDRip.x264.mkv", "Movie.Name.2020.mkv"),
+    ("Movie Name (2020) [1080p] [HEVC].mkv", "Movie.Name.2020.mkv"),
+    ("Bad___Title___2020___mkv___file.mkv", "Bad.Title.2020.mkv"),
+    ("The.Great.Movie.2021.1080p.BluRay.x264.mkv", "The.Great.Movie.2021.mkv"),
+    ("Movie-With-Dashes (2020) [4K].mkv", "Movie-With-Dashes.2020.mkv"),
+    
+    # TV Shows
+    ("Show Name - S01E01 - Episode Name.1080p.HEVC.mkv", "Show.Name.S01E01.mkv"),
+    ("Show.Name.S01E01.1080p.HEVC.mkv", "Show.Name.S01E01.mkv"),
+    ("Show Name S01E01 Episode Title.mkv", "Show.Name.S01E01.mkv"),
+    ("Series.Title.S02E15.720p.x264.mkv", "Series.Title.S02E15.mkv"),
+    
+    # Edge cases
+    ("No.Year.Movie.mkv", "No.Year.Movie.mkv"),
+    ("", ""),
+    ("Single.Word.mkv", "Single.Word.mkv"),
+    ("Multiple   Spaces   2020   .mkv", "Multiple.Spaces.2020.mkv"),
+]
+
+
+# Pattern extraction cases: (filename, expected_pattern_info)
+EXTRACTION_CASES = [
+    # Movies
+    ("Movie Name (2020) [1080p]", {
+        'title': 'Movie Name',
+        'year': '2020',
+        'quality': '1080p',
+        'season': '',
+        'episode': '',
+        'codec': ''
+    }),
+    
+    # TV Shows
+    ("Show Name S01E01", {
+        'title': 'Show Name',
+        'year': '',
+        'quality': '',
+        'season': '01',
+        'episode': '01',
+        'codec': ''
+    }),
+    
+    # Complex case
+    ("The.Great.Movie.2021.1080p.BluRay.x264", {
+        'title': 'The.Great.Movie',
+        'year': '2021',
+        'quality': '1080p',
+        'season': '',
+        'episode': '',
+        'codec': 'AVC'
+    }),
+]
+
+
+# Sanitization cases: (input_name, expected_output)
+SANITIZATION_CASES = [
+    ("[Group] Movie Name (2020)", "Movie Name (2020)"),
+    ("{Group} Movie Name", "Movie Name"),
+    ("Movie___Name___2020", "Movie Name 2020"),
+    ("Movie...Name....2020", "Movie Name 2020"),
+    ("Movie   Name   2020", "Movie Name 2020"),
+    ("Movie<>Name|2020", "Movie_Name_2020"),
+]
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Load the configuration shared by all tests."""
+    return Config()
+
+
+@lru_cache(maxsize=1)
+def _organizer() -> FileOrganizer:
+    """Build the FileOrganizer shared by all tests (its regexes and caches are reused)."""
+    return FileOrganizer(_config(), logger)
+
 
 def test_filename_transformations():
     """Test various filename transformations."""
     
     # Setup
-    config = Config()
-    logger = setup_logger(level="INFO", console=False)
-    organizer = FileOrganizer(config, logger)
-    
-    # Test cases: (input_filename, expected_output)
-    test_cases = [
-        # Movies
-        ("[SomeGroup] Movie.Name.2020.BDRip.x264.mkv", "Movie.Name.2020.mkv"),
-        ("Movie Name (2020) [1080p] [HEVC].mkv", "Movie.Name.2020.mkv"),
-        ("Bad___Title___2020___mkv___file.mkv", "Bad.Title.2020.mkv"),
-        ("The.Great.Movie.2021.1080p.BluRay.x264.mkv", "The.Great.Movie.2021.mkv"),
-        ("Movie-With-Dashes (2020) [4K].mkv", "Movie-With-Dashes.2020.mkv"),
-        
-        # TV Shows
-        ("Show Name - S01E01 - Episode Name.1080p.HEVC.mkv", "Show.Name.S01E01.mkv"),
-        ("Show.Name.S01E01.1080p.HEVC.mkv", "Show.Name.S01E01.mkv"),
-        ("Show Name S01E01 Episode Title.mkv", "Show.Name.S01E01.mkv"),
-        ("Series.Title.S02E15.720p.x264.mkv", "Series.Title.S02E15.mkv"),
-        
-        # Edge cases
-        ("No.Year.Movie.mkv", "No.Year.Movie.mkv"),
-        ("", ""),
-        ("Single.Word.mkv", "Single.Word.mkv"),
-        ("Multiple   Spaces   2020   .mkv", "Multiple.Spaces.2020.mkv"),
-    ]
+    organizer = _organizer()
     
     print("=" * 80)
     print("FILE ORGANIZER TEST - Filename Transformations")
     print("=" * 80)
     
-    passed = 0
-    failed = 0
+    # Run every case first, then report only the mismatches
+    actuals = [
+        organizer.generate_new_filename(input_name, organizer.extract_pattern_info(input_name))
+        for input_name, _ in TRANSFORMATION_CASES
+    ]
+    mismatches = [
+        i for i, (actual, (_, expected)) in enumerate(zip(actuals, TRANSFORMATION_CASES))
+        if actual != expected
+    ]
+    failed = len(mismatches)
+    passed = len(TRANSFORMATION_CASES) - failed
     
-    for input_name, expected in test_cases:
-        # Create a mock file path
-        file_path = Path(input_name)
-        
-        # Extract pattern info
-        pattern_info = organizer.extract_pattern_info(input_name)
-        
-        # Generate new filename
-        actual = organizer.generate_new_filename(file_path, pattern_info)
-        
-        # Check result
-        if actual == expected:
-            status = "PASS"
-            passed += 1
-        else:
-            status = "FAIL"
-            failed += 1
-        
-        print(f"\n{status}")
+    for i in mismatches:
+        input_name, expected = TRANSFORMATION_CASES[i]
+        print("\nFAIL")
         print(f"Input:    {input_name}")
         print(f"Expected: {expected}")
-        print(f"Actual:   {actual}")
-        
-        if actual != expected:
-            print(f"Pattern info: {pattern_info}")
+        print(f"Actual:   {actuals[i]}")
+        print(f"Pattern info: {organizer.extract_pattern_info(input_name)}")
     
     print(f"\n{'=' * 80}")
     print(f"RESULTS: {passed} passed, {failed} failed")
@@ -80,52 +131,20 @@ def test_filename_transformations():
 def test_pattern_extraction():
     """Test pattern extraction from filenames."""
     
-    config = Config()
-    logger = setup_logger(level="INFO", console=False)
-    organizer = FileOrganizer(config, logger)
-    
-    test_cases = [
-        # Movies
-        ("Movie Name (2020) [1080p]", {
-            'title': 'Movie Name',
-            'year': '2020',
-            'quality': '1080p',
-            'season': '',
-            'episode': '',
-            'codec': ''
-        }),
-        
-        # TV Shows
-        ("Show Name S01E01", {
-            'title': 'Show Name',
-            'year': '',
-            'quality': '',
-            'season': '01',
-            'episode': '01',
-            'codec': ''
-        }),
-        
-        # Complex case
-        ("The.Great.Movie.2021.1080p.BluRay.x264", {
-            'title': 'The.Great.Movie',
-            'year': '2021',
-            'quality': '1080p',
-            'season': '',
-            'episode': '',
-            'codec': 'AVC'
-        }),
-    ]
+    organizer = _organizer()
     
     print("\n" + "=" * 80)
     print("PATTERN EXTRACTION TEST")
     print("=" * 80)
     
-    for filename, expected in test_cases:
+    # Collect the report and write it out once
+    out = []
+    for filename, expected in EXTRACTION_CASES:
         actual = organizer.extract_pattern_info(filename)
         
-        print(f"\nFilename: {filename}")
-        print(f"Expected: {expected}")
-        print(f"Actual:   {actual}")
+        out.append(f"\nFilename: {filename}")
+        out.append(f"Expected: {expected}")
+        out.append(f"Actual:   {actual}")
         
         # Check key fields
         matches = []
@@ -135,37 +154,32 @@ def test_pattern_extraction():
             else:
                 matches.append(f"{key}: FAIL ({actual.get(key)} != {expected.get(key)})")
         
-        print(f"Results:  {', '.join(matches)}")
+        out.append(f"Results:  {', '.join(matches)}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def test_sanitization():
     """Test filename sanitization."""
     
-    config = Config()
-    logger = setup_logger(level="INFO", console=False)
-    organizer = FileOrganizer(config, logger)
-    
-    test_cases = [
-        ("[Group] Movie Name (2020)", "Movie Name (2020)"),
-        ("{Group} Movie Name", "Movie Name"),
-        ("Movie___Name___2020", "Movie Name 2020"),
-        ("Movie...Name....2020", "Movie Name 2020"),
-        ("Movie   Name   2020", "Movie Name 2020"),
-        ("Movie<>Name|2020", "Movie_Name_2020"),
-    ]
+    organizer = _organizer()
     
     print("\n" + "=" * 80)
     print("SANITIZATION TEST")
     print("=" * 80)
     
-    for input_name, expected in test_cases:
+    # Collect the report and write it out once
+    out = []
+    for input_name, expected in SANITIZATION_CASES:
         actual = organizer.sanitize_filename(input_name)
         
-        print(f"Input:    {input_name}")
-        print(f"Expected: {expected}")
-        print(f"Actual:   {actual}")
-        print(f"Status:   {'PASS' if actual == expected else 'FAIL'}")
-        print()
+        out.append(f"Input:    {input_name}")
+        out.append(f"Expected: {expected}")
+        out.append(f"Actual:   {actual}")
+        out.append(f"Status:   {'PASS' if actual == expected else 'FAIL'}")
+        out.append('')
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():